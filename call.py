@@ -11,14 +11,18 @@ import sys
 from PySide2 import QtCore
 from PySide2 import QtWidgets
 
+from kore import constant
+
 from widgets import main
 
 from widgets import SplashScreen
+from widgets import prewarmPixmaps
 
 
 def execute(standalone=True):
     if standalone:
         appn = QtWidgets.QApplication(sys.argv)
+        prewarmPixmaps(["cache-title", constant.TOOL_IOCN])  # Decoded while the splash shows
         splash = SplashScreen()
         splash.show()
 
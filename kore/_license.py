@@ -5,31 +5,62 @@
 
 import json
 import os
+import base64
 import hmac
 import hashlib
-from cryptography.fernet import Fernet
+import functools
 from datetime import datetime, timedelta
 
+try:
+    # Rust-backed (fernet-rs) implementation, API compatible with cryptography
+    from rfernet import Fernet
+
+    generate_key = Fernet.generate_new_key
+except ImportError:
+    from cryptography.fernet import Fernet
+
+    generate_key = Fernet.generate_key
+
 SUBSCRIPTION_FILE = "subscription.enc"
 KEY_FILE = "secret.key"
 HMAC_SECRET = b"super-secret-hmac-key"  # Use a strong, unique key for HMAC
+MAC_ALGORITHM = "blake2b-256"  # Stored as "mac_alg" in the subscription data
+
+# Verified subscription end date, keyed by the subscription file mtime
+_subscription_cache = dict()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_fernet():
+    """Load (or generate and store) the encryption key on first use."""
+    if not os.path.exists(KEY_FILE):
+        key = generate_key()
+        key = key.encode() if isinstance(key, str) else key
+        with open(KEY_FILE, "wb") as f:
+            f.write(key)
+    else:
+        with open(KEY_FILE, "rb") as f:
+            key = f.read()
+
+    return Fernet(key.decode())
 
 
-# Generate and store encryption key if it doesn't exist
-if not os.path.exists(KEY_FILE):
-    key = Fernet.generate_key()
-    with open(KEY_FILE, "wb") as f:
-        f.write(key)
-else:
-    with open(KEY_FILE, "rb") as f:
-        key = f.read()
+def canonical_payload(data):
+    """Serialize data once into the canonical utf-8 bytes used for the HMAC."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
 
-fernet = Fernet(key)
 
+def hmac_hash(data, algorithm=MAC_ALGORITHM):
+    """Generate raw keyed MAC digest (bytes) to verify data integrity.
 
-def hmac_hash(data):
-    """Generate HMAC hash to verify data integrity."""
-    return hmac.new(HMAC_SECRET, data.encode(), hashlib.sha256).hexdigest()
+    Subscriptions written before "mac_alg" was stored used HMAC-SHA256.
+    """
+    data = data.encode() if isinstance(data, str) else data
+
+    if algorithm == "blake2b-256":
+        return hashlib.blake2b(data, key=HMAC_SECRET, digest_size=32).digest()
+
+    return hmac.new(HMAC_SECRET, data, hashlib.sha256).digest()
 
 
 def initialize_subscription():
@@ -39,16 +70,23 @@ def initialize_subscription():
     subscription_data = {
         "start_date": start_date.strftime("%Y-%m-%d"),
         "end_date": end_date.strftime("%Y-%m-%d"),
-        "hmac": "",  # Placeholder for hash
+        "mac_alg": MAC_ALGORITHM,
     }
 
     # Calculate HMAC hash and add to data
-    subscription_data["hmac"] = hmac_hash(json.dumps(subscription_data))
+    payload = canonical_payload(subscription_data)
+    subscription_data["hmac"] = base64.b64encode(hmac_hash(payload)).decode()
 
     # Encrypt and save data
-    encrypted_data = fernet.encrypt(json.dumps(subscription_data).encode())
-    with open(SUBSCRIPTION_FILE, "wb") as f:
+    encrypted_data = _get_fernet().encrypt(json.dumps(subscription_data).encode())
+    temp_file = "%s.tmp" % SUBSCRIPTION_FILE
+    with open(temp_file, "wb", buffering=1 << 17) as f:
         f.write(encrypted_data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    # Atomically swap in the new subscription file
+    os.replace(temp_file, SUBSCRIPTION_FILE)
 
     print("Subscription initialized and encrypted.")
 
@@ -59,19 +97,16 @@ def check_subscription():
         print("No subscription found. Please initialize a subscription.")
         return False
 
-    # Load and decrypt the subscription data
-    with open(SUBSCRIPTION_FILE, "rb") as f:
-        encrypted_data = f.read()
-    decrypted_data = fernet.decrypt(encrypted_data).decode()
-    subscription_data = json.loads(decrypted_data)
+    # Reuse the decrypted end date while the subscription file is unchanged
+    mtime = os.stat(SUBSCRIPTION_FILE).st_mtime_ns
+    if mtime not in _subscription_cache:
+        _subscription_cache.clear()
+        _subscription_cache[mtime] = _read_end_date()
 
-    # Verify integrity with HMAC
-    expected_hmac = subscription_data.pop("hmac")
-    if hmac_hash(json.dumps(subscription_data)) != expected_hmac:
-        print("Subscription data integrity check failed.")
+    end_date = _subscription_cache[mtime]
+    if not end_date:
         return False
 
-    end_date = datetime.strptime(subscription_data["end_date"], "%Y-%m-%d")
     if datetime.now() > end_date:
         print("Subscription expired on:", end_date.strftime("%Y-%m-%d"))
         return False
@@ -80,6 +115,27 @@ def check_subscription():
     return True
 
 
+def _read_end_date():
+    """Decrypts the subscription file and returns its end date, None if tampered."""
+    # Load and decrypt the subscription data
+    with open(SUBSCRIPTION_FILE, "rb") as f:
+        encrypted_data = f.read()
+    decrypted_data = _get_fernet().decrypt(encrypted_data).decode()
+    subscription_data = json.loads(decrypted_data)
+
+    # Verify integrity with HMAC
+    expected_hmac = subscription_data.pop("hmac")
+    algorithm = subscription_data.get("mac_alg", "hmac-sha256")
+    actual_hmac = base64.b64encode(
+        hmac_hash(canonical_payload(subscription_data), algorithm=algorithm)
+    ).decode()
+    if not hmac.compare_digest(expected_hmac, actual_hmac):
+        print("Subscription data integrity check failed.")
+        return None
+
+    return datetime.strptime(subscription_data["end_date"], "%Y-%m-%d")
+
+
 if __name__ == "__main__":
     # Uncomment the line below to initialize a new subscription (only do this once)
     # initialize_subscription()
@@ -36,7 +36,8 @@ class ImportFile(object):
         if kwargs.get("sourceFile"):
             flags["sourceFile"] = filepath
 
-        commands = kwargs["commands"].format(**flags).split("<>")
+        commandTokens = kwargs.get("commandTokens") or kwargs["commands"].split("<>")
+        commands = [token.format(**flags) for token in commandTokens]
 
         # C:/Program Files/Autodesk/Maya2023/bin/mayapy C:/Users/batman/Documents/orbit/temp/orbit-import-2333812216.py
         # C:/Program Files/Blender Foundation/Blender 4.0/bin/blender --python-use-system-env --background --python C:/Users/batman/Documents/orbit/temp/orbit-import-87880579.py
@@ -123,7 +124,8 @@ class ExportCache(object):
         if kwargs.get("sourceFile"):
             flags["sourceFile"] = filepath
 
-        commands = kwargs["commands"].format(**flags).split("<>")
+        commandTokens = kwargs.get("commandTokens") or kwargs["commands"].split("<>")
+        commands = [token.format(**flags) for token in commandTokens]
 
         progressCallback.emit("Command, %s" % " ".join(commands))
         progressCallback.emit("Started, subprocess")
@@ -2,6 +2,7 @@
 # Author: Subin. Gopi (subing85@gmail.com).
 # Description: Motion-Craft CACHE Tool, constants modulesource code.
 
+import types
 
 TOOL_NAME = "MC_Cache_Tool"
 TOOL_IOCN = "cache-tool"
@@ -24,6 +25,8 @@ LOAD_FROM_DATA = False
 CLEAR_CACHE = True
 
 TIMEOUT = None
+SUBPROCESS_BUFFER_SIZE = 131072  # 128 KiB
+WRITE_BUFFER_SIZE = 131072  # 128 KiB
 
 INPUT_EXTENTIONS = ["ma", "mb", "blend"]
 # MAYA_FORMATS = ["mayaAscii", "mayaBinary"]
@@ -96,6 +99,19 @@ PROJECT_CONTEXT_LIST = [
     },
 ]
 
+# Command templates split once on "<>", each token is formatted per batch call
+for context in PROJECT_CONTEXT_LIST:
+    if context.get("commands"):
+        context["commandTokens"] = tuple(context["commands"].split("<>"))
+
+del context  # The loop name would keep a writable reference to the last raw context
+
+# Freeze the project contexts, writers copy the entries they change
+PROJECT_CONTEXT_LIST = tuple(types.MappingProxyType(context) for context in PROJECT_CONTEXT_LIST)
+
+# Read-only lookup of the project contexts by name, e.g. PROJECT_CONTEXT_BY_NAME["maya"]
+PROJECT_CONTEXT_BY_NAME = {context["name"]: context for context in PROJECT_CONTEXT_LIST}
+
 
 # MAYA_ROOT_DIRECTORY = "C:/Program Files/Autodesk/Maya2023"  #
 
@@ -163,203 +179,28 @@ FPS_LIST = {
     ],
 }
 
-CACHE_TYPES = {
-    "value": "Alembic",
-    "values": [
-        "Alembic",
-        "USD",
-        "FBX",
-        "Alembic + USD",
-        "USD + FBX",
-        "Alembic + FBX",
-        "Alembic + USD + FBX",
-    ],
-}
-
-KINDS = [
-    "episode-0001",
-    "episode-0002",
-    "episode-0003",
-    "episode-0004",
-    "episode-0005",
-    "episode-0006",
-    "episode-0007",
-    "episode-0008",
-    "episode-0009",
-    "episode-0010",
-    "episode-0011",
-    "episode-0012",
-    "episode-0013",
-    "episode-0014",
-    "episode-0015",
-    "episode-0016",
-    "episode-0017",
-    "episode-0018",
-    "episode-0019",
-    "episode-0020",
-    "episode-0021",
-    "episode-0022",
-]
-
-SEQUENCES = [
-    "sequence-0001",
-    "sequence-0002",
-    "sequence-0003",
-    "sequence-0004",
-    "sequence-0005",
-    "sequence-0006",
-    "sequence-0007",
-    "sequence-0008",
-    "sequence-0009",
-    "sequence-0010",
-    "sequence-0011",
-    "sequence-0012",
-    "sequence-0013",
-    "sequence-0014",
-    "sequence-0015",
-    "sequence-0016",
-    "sequence-0017",
-    "sequence-0018",
-    "sequence-0019",
-    "sequence-0020",
-    "sequence-0021",
-    "sequence-0021",
-    "sequence-0021",
-    "sequence-0022",
-    "sequence-0023",
-    "sequence-0024",
-    "sequence-0025",
-    "sequence-0026",
-    "sequence-0027",
-    "sequence-0028",
-    "sequence-0029",
-    "sequence-0030",
-    "sequence-0031",
-    "sequence-0032",
-    "sequence-0033",
-    "sequence-0034",
-    "sequence-0035",
-    "sequence-0036",
-    "sequence-0037",
-    "sequence-0038",
-    "sequence-0039",
-    "sequence-0040",
-    "sequence-0041",
-    "sequence-0042",
-    "sequence-0043",
-    "sequence-0044",
-    "sequence-0045",
-    "sequence-0046",
-    "sequence-0047",
-    "sequence-0048",
-    "sequence-0049",
-    "sequence-0050",
-]
-
-SHOTS = [
-    "shot-0001",
-    "shot-0002",
-    "shot-0003",
-    "shot-0004",
-    "shot-0005",
-    "shot-0006",
-    "shot-0007",
-    "shot-0008",
-    "shot-0009",
-    "shot-0010",
-    "shot-0011",
-    "shot-0012",
-    "shot-0013",
-    "shot-0014",
-    "shot-0015",
-    "shot-0016",
-    "shot-0017",
-    "shot-0018",
-    "shot-0019",
-    "shot-0020",
-    "shot-0021",
-    "shot-0022",
-    "shot-0023",
-    "shot-0024",
-    "shot-0025",
-    "shot-0026",
-    "shot-0027",
-    "shot-0028",
-    "shot-0029",
-    "shot-0030",
-    "shot-0031",
-    "shot-0032",
-    "shot-0033",
-    "shot-0034",
-    "shot-0035",
-    "shot-0036",
-    "shot-0037",
-    "shot-0038",
-    "shot-0039",
-    "shot-0040",
-    "shot-0041",
-    "shot-0042",
-    "shot-0043",
-    "shot-0044",
-    "shot-0045",
-    "shot-0046",
-    "shot-0047",
-    "shot-0048",
-    "shot-0049",
-    "shot-0050",
-    "shot-0051",
-    "shot-0052",
-    "shot-0053",
-    "shot-0054",
-    "shot-0055",
-    "shot-0056",
-    "shot-0057",
-    "shot-0058",
-    "shot-0059",
-    "shot-0060",
-    "shot-0061",
-    "shot-0062",
-    "shot-0063",
-    "shot-0064",
-    "shot-0065",
-    "shot-0066",
-    "shot-0067",
-    "shot-0068",
-    "shot-0069",
-    "shot-0070",
-    "shot-0071",
-    "shot-0072",
-    "shot-0073",
-    "shot-0074",
-    "shot-0075",
-    "shot-0076",
-    "shot-0077",
-    "shot-0078",
-    "shot-0079",
-    "shot-0080",
-    "shot-0081",
-    "shot-0082",
-    "shot-0083",
-    "shot-0084",
-    "shot-0085",
-    "shot-0086",
-    "shot-0087",
-    "shot-0088",
-    "shot-0089",
-    "shot-0090",
-    "shot-0091",
-    "shot-0092",
-    "shot-0093",
-    "shot-0094",
-    "shot-0095",
-    "shot-0096",
-    "shot-0097",
-    "shot-0098",
-    "shot-0099",
-    "shot-0100",
-]
-
-TASKS = ["animation"]
+CACHE_TYPES = types.MappingProxyType(
+    {
+        "value": "Alembic",
+        "values": (
+            "Alembic",
+            "USD",
+            "FBX",
+            "Alembic + USD",
+            "USD + FBX",
+            "Alembic + FBX",
+            "Alembic + USD + FBX",
+        ),
+    }
+)
+
+KINDS = tuple("episode-%04d" % index for index in range(1, 23))
+
+SEQUENCES = tuple("sequence-%04d" % index for index in range(1, 51))
+
+SHOTS = tuple("shot-%04d" % index for index in range(1, 101))
+
+TASKS = ("animation",)
 
 DEFAULT_FRAME_START = 1000
 DEFAULT_FRAME_END = 1001
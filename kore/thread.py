@@ -57,37 +57,32 @@ class WorkerExportRunner(WorkerImportRunner):
     name = "export"
 
 
-class _WorkerExportRunner(QtCore.QRunnable):
-    def __init__(self, fn, *args, **kwargs):
-        super(WorkerExportRunner, self).__init__()
+class VersionSignals(QtCore.QObject):
+    finished = QtCore.Signal(int, str)
+
+
+class WorkerVersionRunner(QtCore.QRunnable):
+    name = "version"
+
+    def __init__(self, fn, sequence, directory):
+        super(WorkerVersionRunner, self).__init__()
 
         self.fn = fn
-        self.filepath = args[0]
-        self.displayLogs = args[1]
-        self.widget = args[2]
-        self.kwargs = kwargs
+        self.sequence = sequence  # Lets the receiver drop the results of stale requests
+        self.directory = directory
 
-        self.signals = WorkerSignals()
+        self.signals = VersionSignals()
 
         self.setAutoDelete(True)
 
-        self.kwargs["logger"] = self.displayLogs
-        self.kwargs["progressCallback"] = self.signals.progress
-
     def run(self):
         try:
-            result = self.fn(self.filepath, self.widget, **self.kwargs)
+            result = self.fn(self.directory)
         except:
             traceback.print_exc()
-            exctype, value = sys.exc_info()[:2]
-            self.signals.error.emit((exctype, value, traceback.format_exc(), self.widget))
-            result = None
-        else:
-            context = {"widget": self.widget, "result": result}
-            self.signals.result.emit(context)
-        finally:
-            context = {"widget": self.widget, "result": result}
-            self.signals.finished.emit(context)
+            return
+
+        self.signals.finished.emit(self.sequence, result)
 
 
 if __name__ == "__main__":
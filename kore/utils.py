@@ -7,11 +7,14 @@ from __future__ import absolute_import
 
 import os
 import re
+import ast
 import json
 import stat
-import uuid
+import types
 import random
+import secrets
 import getpass
+import functools
 import tempfile
 import subprocess
 import webbrowser
@@ -20,6 +23,11 @@ import resources
 
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from jinja2 import Template
 from jinja2 import Environment
 from jinja2 import FileSystemLoader
@@ -31,6 +39,8 @@ LOGGER = logger.getLogger(__name__)
 
 CURRENT_PATH = os.path.dirname(__file__)
 
+VERSION_PATTERN = re.compile(r"^\d{%d}$" % constant.VERSION_PADDING)
+
 
 def getProjectContextList():
     return constant.PROJECT_CONTEXT_LIST
@@ -38,7 +48,13 @@ def getProjectContextList():
 
 def pathResolver(path, folders=None, filename=None):
     folders = folders or []
-    folders = [x for x in folders if x and isinstance(x, str)]
+    folders = tuple(x for x in folders if x and isinstance(x, str))
+
+    return _resolvePath(path, folders, filename)
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolvePath(path, folders, filename):
     expand_path = os.path.expandvars(path)
 
     if folders:
@@ -89,16 +105,23 @@ def hasPathExists(path):
         return False
 
     abspath = os.path.expandvars(path)
-    if os.path.isdir(abspath):
+    if _isDirectory(abspath):
         return True
 
     if hasFile(abspath):
         abspath = os.path.dirname(abspath)
-        return os.path.isdir(abspath)
+        return _isDirectory(abspath)
 
     return False
 
 
+def _isDirectory(path):
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
 def hasFile(filepath):
     dirname, extenstion = os.path.splitext(filepath)
     return True if extenstion else False
@@ -115,7 +138,8 @@ def makedirs(path):
     if os.path.isdir(abspath):
         return
 
-    os.makedirs(abspath)
+    # Concurrent workers may create the same directory, an existing one is not an error
+    os.makedirs(abspath, exist_ok=True)
     LOGGER.info("Created new directory, %s" % abspath)
 
 
@@ -127,17 +151,20 @@ def deleteFiles(filepaths, verbose=False):
 
     for filepath in filepaths:
         filepath = pathResolver(filepath)
-        if not os.path.isfile(filepath):
-            return
         try:
-            os.chmod(filepath, stat.S_IWRITE)
+            os.unlink(filepath)
             valid = True
-        except Exception as error:
-            valid = False
-        try:
-            os.remove(filepath)
-            valid = True
-        except Exception as error:
+        except (FileNotFoundError, IsADirectoryError):
+            continue
+        except PermissionError:
+            # Read-only file (Windows), make it writable only when the unlink failed
+            try:
+                os.chmod(filepath, stat.S_IWRITE)
+                os.unlink(filepath)
+                valid = True
+            except OSError:
+                valid = False
+        except OSError:
             valid = False
 
         if valid and verbose:
@@ -168,6 +195,11 @@ def getUserName():
 def writeJsonFile(context, filepath):
     makedirs(filepath)
 
+    if orjson:
+        with open(filepath, "wb") as target:
+            target.write(orjson.dumps(context, option=orjson.OPT_INDENT_2))
+        return
+
     with open(filepath, "w") as target:
         target.write(json.dumps(context, indent=4))
 
@@ -176,15 +208,40 @@ def readJsonFile(filepath):  # remove this function
     if not hasFileExists(filepath):
         return dict()
 
+    if orjson:
+        with open(filepath, "rb") as target:
+            return orjson.loads(target.read())
+
     with open(filepath, "r") as target:
         return json.load(target)
 
 
+def readCachedJsonFile(filepath):
+    """Read-only json content, parsed again only when the file modification time changes."""
+
+    try:
+        mtime = os.stat(filepath).st_mtime_ns
+    except OSError:
+        return types.MappingProxyType(dict())
+
+    return _readJsonFileAt(filepath, mtime)
+
+
+@functools.lru_cache(maxsize=4)
+def _readJsonFileAt(filepath, mtime):
+    return types.MappingProxyType(readJsonFile(filepath))
+
+
 def writeData(filepath, content):
     makedirs(filepath)
-    with open(filepath, "w") as data:
+
+    # Write next to the target and swap it in, a crash never leaves a partial file
+    temppath = "%s.tmp" % filepath
+    with open(temppath, "w", buffering=constant.WRITE_BUFFER_SIZE) as data:
         data.write(content)
-        return filepath
+
+    os.replace(temppath, filepath)
+    return filepath
 
 
 def getTmpDirectory():
@@ -192,8 +249,7 @@ def getTmpDirectory():
 
 
 def getTempName(prefix):
-    name = "orbit-%s-%s" % (prefix, int(uuid.uuid1().time_low))
-    # name = "orbit-%s-%s" % (prefix, int(uuid.uuid1().time))
+    name = "orbit-%s-%s" % (prefix, secrets.token_hex(4))
 
     return name
 
@@ -222,7 +278,12 @@ def _executeSubprocess(commands, shell, env, communicate, wait):
     commands = [commands] if isinstance(commands, str) else commands
 
     process = subprocess.Popen(
-        commands, shell=shell, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env
+        commands,
+        shell=shell,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+        bufsize=constant.SUBPROCESS_BUFFER_SIZE,
     )
 
     _communicate = None
@@ -237,7 +298,7 @@ def _executeSubprocess(commands, shell, env, communicate, wait):
 
 
 def executeSubprocess(commands, shell, env, timeout, logger=False):
-    parameters = {"shell": shell, "env": env}
+    parameters = {"shell": shell, "env": env, "bufsize": constant.SUBPROCESS_BUFFER_SIZE}
 
     if not logger:
         parameters.update({"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL})
@@ -255,22 +316,44 @@ def executeSubprocess(commands, shell, env, timeout, logger=False):
     return valid, None
 
 
+@functools.lru_cache(maxsize=None)
+def _codeEnvironment(directory):
+    fileLoader = FileSystemLoader(directory)
+    return Environment(loader=fileLoader, auto_reload=False, cache_size=400)
+
+
+@functools.lru_cache(maxsize=None)
+def _codeTemplate(directory, code):
+    return _codeEnvironment(directory).get_template("%s.code" % code)
+
+
+@functools.lru_cache(maxsize=None)
+def _dataTemplate(code):
+    templateData = resources.getCodeData(code)
+    return Template(templateData)
+
+
 def getCodeTemaplate(code, fromData=False):
     if fromData:
-        templateData = resources.getCodeData(code)
-        template = Template(templateData)
+        template = _dataTemplate(code)
     else:
-        directory = resources.getCodePath()
-        fileLoader = FileSystemLoader(directory)
-        env = Environment(loader=fileLoader)
-        template = env.get_template("%s.code" % code)
+        template = _codeTemplate(resources.getCodePath(), code)
 
     return template
 
 
+@functools.lru_cache(maxsize=1)
+def _batchResultPattern():
+    return re.compile(
+        r"{}\s*(.*?)\s*{}".format(constant.BATCH_START_COMMENTS, constant.BATCH_END_COMMENTS)
+    )
+
+
 def decodeCommunicate(communicates, verbose=False):
     resultList = list()
 
+    pattern = _batchResultPattern()
+
     for communicate in communicates:
         text = communicate.decode()
 
@@ -278,14 +361,11 @@ def decodeCommunicate(communicates, verbose=False):
             print(text)
 
         # Use a regular expression to find the list inside the string
-        match = re.search(
-            r"{}\s*(.*?)\s*{}".format(constant.BATCH_START_COMMENTS, constant.BATCH_END_COMMENTS),
-            text,
-        )
+        match = pattern.search(text)
 
         if match:
             result = match.group(1)  # group(1) to get content between the two markers
-            resultList.append(eval(result))
+            resultList.append(ast.literal_eval(result))
 
     return resultList
 
@@ -294,12 +374,14 @@ def searchversions(directory, reverse=False):
     if not hasPathExists(directory):
         return list()
 
-    folders = os.listdir(directory)
-
-    pattern = re.compile(r"^\d{%s}$" % constant.VERSION_PADDING)
-    filteredList = [item for item in folders if pattern.match(item)]
+    with os.scandir(directory) as entries:
+        filteredList = [
+            entry.name
+            for entry in entries
+            if VERSION_PATTERN.match(entry.name) and entry.is_dir()
+        ]
 
-    versions = sorted(filteredList, reverse=True)
+    versions = sorted(filteredList, reverse=reverse)
 
     return versions
 
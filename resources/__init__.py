@@ -5,6 +5,7 @@
 from __future__ import absolute_import
 
 import os
+import functools
 
 from kore import constant
 
@@ -15,6 +16,7 @@ def getIconPath():
     return os.path.join(CURRENT_PATH, "icons")
 
 
+@functools.lru_cache(maxsize=None)
 def getIconFilepath(name):
     iconPath = getIconPath()
 
@@ -123,9 +125,9 @@ def doIt(**kwargs):
         logger.error("ReadError: %s" % error)
         return
 
-    pyclass.input = kwargs
-    pyclass.execute()
-    result = pyclass.output.get("result")
+    instance = pyclass(**kwargs)
+    instance.execute()
+    result = instance.output.get("result")
 
     with open("{{context["jsonFilepath"]}}", "w") as target:
         target.write(json.dumps(result, indent=4))
@@ -175,9 +177,9 @@ def doIt(**kwargs):
         logger.error("ReadError: %s" % error)
         return
 
-    pyclass.input = kwargs
-    pyclass.execute()
-    result = pyclass.output.get("result")
+    instance = pyclass(**kwargs)
+    instance.execute()
+    result = instance.output.get("result")
 
     with open("{{context["jsonFilepath"]}}", "w") as target:
         target.write(json.dumps(result, indent=4))
@@ -227,9 +229,9 @@ def doIt(**kwargs):
         logger.error("ReadError: %s" % error)
         return
 
-    pyclass.input = kwargs
-    pyclass.execute()
-    result = pyclass.output.get("result")
+    instance = pyclass(**kwargs)
+    instance.execute()
+    result = instance.output.get("result")
 
     with open("{{context["jsonFilepath"]}}", "w") as target:
         target.write(json.dumps(result, indent=4))
@@ -273,9 +275,9 @@ def doIt(**kwargs):
         logger.error("ReadError: %s" % error)
         return
 
-    pyclass.input = kwargs
-    pyclass.execute()
-    result = pyclass.output.get("result")
+    instance = pyclass(**kwargs)
+    instance.execute()
+    result = instance.output.get("result")
 
     with open("{{context["jsonFilepath"]}}", "w") as target:
         target.write(json.dumps(result, indent=4))
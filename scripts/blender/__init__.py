@@ -13,15 +13,15 @@ class ImportSource(object):
     """Class for importing source files and managing node operations in Blender.
 
     Attributes:
-        input (dict): A dictionary to hold input parameters for the import operation.
+        input (dict): Input parameters for the import operation, given to the constructor.
         output (dict): A dictionary to store output results after execution.
     """
 
-    input = dict()
-    output = dict()
+    def __init__(self, **input):
+        self.input = input
+        self.output = dict()
 
-    @classmethod
-    def execute(cls):
+    def execute(self):
         """Executes the import operation for the specified Maya file.
 
         This method retrieves the file path, default nodes, and node names from
@@ -44,10 +44,10 @@ class ImportSource(object):
             KeyError: If the expected keys are not found in the input dictionary.
         """
 
-        # Retrieve the input parameters from the class dictionary
-        filepath = cls.input["filepath"]  # Path to the Maya file
-        defaultNodes = cls.input["defaultNodes"]  # List of default nodes
-        nodeNames = cls.input["nodeNames"]  # List of specific node names
+        # Retrieve the input parameters from the input dictionary
+        filepath = self.input["filepath"]  # Path to the Maya file
+        defaultNodes = self.input["defaultNodes"]  # List of default nodes
+        nodeNames = self.input["nodeNames"]  # List of specific node names
 
         # Uncomment if scene opening is needed (currently commented out)
         # utils.openScene(filepath)  # Open the specified Blender scene
@@ -66,22 +66,24 @@ class ImportSource(object):
         }
 
         # Store the result in the output dictionary
-        cls.output = {"result": collections}
+        self.output = {"result": collections}
+
+        return self.output
 
 
 class ExportCache(object):
     """Class for exporting cache files (Alembic, USD, FBX) from Blender.
 
     Attributes:
-        input (dict): A dictionary to hold input parameters for the export operation.
+        input (dict): Input parameters for the export operation, given to the constructor.
         output (dict): A dictionary to store output results after execution.
     """
 
-    input = dict()
-    output = dict()
+    def __init__(self, **input):
+        self.input = input
+        self.output = dict()
 
-    @classmethod
-    def execute(cls):
+    def execute(self):
         """Executes the export operation for the specified cache files.
 
         This method retrieves input parameters for file paths, frame range, cache type,
@@ -113,21 +115,22 @@ class ExportCache(object):
             KeyError: If the expected keys are not found in the input dictionary.
         """
 
-        # Retrieve input parameters from the class dictionary
-        filepath = cls.input["filepath"]  # Path to save cache files
-        frameStart = cls.input["frameStart"]  # Start frame for export
-        frameEnd = cls.input["frameEnd"]  # End frame for export
-        cache = cls.input["cache"]  # Cache type (0-6)
-        cameraFBX = cls.input["cameraFBX"]  # Boolean for camera FBX export
+        # Retrieve input parameters from the input dictionary
+        filepath = self.input["filepath"]  # Path to save cache files
+        frameStart = self.input["frameStart"]  # Start frame for export
+        frameEnd = self.input["frameEnd"]  # End frame for export
+        cache = self.input["cache"]  # Cache type (0-6)
+        cameraFBX = self.input["cameraFBX"]  # Boolean for camera FBX export
         # List of nodes to export, example ['scahin_models', 'ball_models', 'bat_geometrys']
-        nodes = cls.input["nodes"]
-        localPath = cls.input["localPath"]  # Local directory path for cache files
+        nodes = self.input["nodes"]
+        # Local directory path for cache files, resolved once for every export
+        localPath = utils.getLocalPath(self.input["localPath"])
 
         # Get optional parameters with default values
-        axis = cls.input.get("axis") or "y"  # Default axis is "y"
-        time = cls.input.get("fps") or "film"  # Default time is "film"
-        unit = cls.input.get("unit") or "centimeter"  # Default unit is "centimeter"
-        angle = cls.input.get("angle") or "degree"  # Default angle is "degree"
+        axis = self.input.get("axis") or "y"  # Default axis is "y"
+        time = self.input.get("fps") or "film"  # Default time is "film"
+        unit = self.input.get("unit") or "centimeter"  # Default unit is "centimeter"
+        angle = self.input.get("angle") or "degree"  # Default angle is "degree"
 
         # Load necessary plugins for exporting
         utils.loadPlugins()
@@ -142,24 +145,30 @@ class ExportCache(object):
         # Get the current camera transforms
         cameraList = utils.getCameraTransforms()
 
+        # Build the name lookups once for all nodes
+        sceneMaps = utils.getSceneMaps()
+
+        # Create local path directory if it does not exist
+        os.makedirs(localPath, exist_ok=True)
+
         cachedList = list()  # List to hold export results
-        nodeNames = list()  # List to keep track of processed node names
+        nodeNames = set()  # Set to keep track of processed node names
 
         # Loop through each node to perform exports
         for node in nodes:
             # Get the node name
-            nodeName = utils.getNodeName(node)
+            nodeName = utils.getNodeName(node, sceneMaps=sceneMaps)
 
             if not nodeName:  # Skip if the node name is not valid
                 continue
 
             # Ensure unique node names by appending a count if necessary
             if nodeName in nodeNames:
-                nodeName = "%s_%s" % (nodeName, len(nodeNames))
+                nodeName = f"{nodeName}_{len(nodeNames)}"
 
-            # Create local path directory if it does not exist
-            if not os.path.isdir(localPath):
-                os.makedirs(localPath)
+            # Get and select the node objects once, shared by every export of this node
+            objects = utils.getObjects(node, sceneMaps=sceneMaps)
+            utils.selectObject(objects)
 
             # Flag to track if FBX export was performed
             isFbxExport = False
@@ -169,7 +178,16 @@ class ExportCache(object):
 
             # Check if the node is a camera and export as FBX if specified
             if node in cameraList and cameraFBX:
-                result = utils.exportFbx(localPath, nodeName, node, frameStart, frameEnd)
+                result = utils.exportFbx(
+                    localPath,
+                    nodeName,
+                    node,
+                    frameStart,
+                    frameEnd,
+                    sceneMaps=sceneMaps,
+                    objects=objects,
+                    selected=True,
+                )
                 # Append the export result
                 cachedList.append(result)
                 isFbxExport = True
@@ -178,29 +196,58 @@ class ExportCache(object):
 
             # Alembic export conditions
             if cache in [0, 3, 5, 6]:
-                result = utils.exportAlembic(localPath, nodeName, node, frameStart, frameEnd)
+                result = utils.exportAlembic(
+                    localPath,
+                    nodeName,
+                    node,
+                    frameStart,
+                    frameEnd,
+                    sceneMaps=sceneMaps,
+                    objects=objects,
+                    selected=True,
+                )
                 cachedList.append(result)
 
             # USD export conditions
             if cache in [1, 3, 4, 6]:
                 # Usd export
-                result = utils.exportUsd(localPath, nodeName, node, frameStart, frameEnd)
+                result = utils.exportUsd(
+                    localPath,
+                    nodeName,
+                    node,
+                    frameStart,
+                    frameEnd,
+                    sceneMaps=sceneMaps,
+                    objects=objects,
+                    selected=True,
+                )
                 cachedList.append(result)
 
             # FBX export if not already done
             if cache in [2, 4, 5, 6] and not isFbxExport:
                 # FBX export
-                result = utils.exportFbx(localPath, nodeName, node, frameStart, frameEnd)
+                result = utils.exportFbx(
+                    localPath,
+                    nodeName,
+                    node,
+                    frameStart,
+                    frameEnd,
+                    sceneMaps=sceneMaps,
+                    objects=objects,
+                    selected=True,
+                )
                 cachedList.append(result)
 
-            # Add the final result for this node
-            cachedList.append(result)
+            # Clear the node selection once all its exports are done
+            utils.deselectObjects()
 
             # Track processed node names
-            nodeNames.append(nodeName)
+            nodeNames.add(nodeName)
 
         # Store the results in the output dictionary
-        cls.output = {"result": {"outputs": cachedList, "localPath": localPath}}
+        self.output = {"result": {"outputs": cachedList, "localPath": localPath}}
+
+        return self.output
 
 
 if __name__ == "__main__":
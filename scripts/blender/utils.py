@@ -6,9 +6,19 @@
 from __future__ import absolute_import
 
 import os
+import re
 import sys
 import logging
 
+from itertools import chain
+from collections import deque
+
+try:
+    import bpy
+except ImportError:
+    # Allow importing this module outside of Blender
+    bpy = None
+
 # Configure logging settings for tracking progress and errors
 logging.basicConfig(
     level=logging.INFO,
@@ -20,6 +30,175 @@ logging.basicConfig(
 # Create a logger instance for this module
 LOGGER = logging.getLogger(__name__)
 
+# Object types included in the FBX export
+FBX_OBJECT_TYPES = {"ARMATURE", "CAMERA", "EMPTY", "LIGHT", "MESH", "OTHER"}
+
+# Export operator settings, built once at import and shared by every node export
+FBX_EXPORT_OPTIONS = {
+    "use_selection": True,
+    "bake_anim": True,
+    "bake_anim_use_all_bones": True,
+    "bake_anim_use_nla_strips": True,
+    "bake_anim_use_all_actions": True,
+    "bake_anim_force_startend_keying": True,
+    "bake_anim_step": 1.0,
+    "bake_anim_simplify_factor": 1.0,
+    "check_existing": True,
+    "filter_glob": "*.fbx",
+    "use_visible": False,
+    "use_active_collection": False,
+    # "collection": "",
+    "global_scale": 1.0,
+    "apply_unit_scale": True,
+    "apply_scale_options": "FBX_SCALE_NONE",
+    "use_space_transform": True,
+    "bake_space_transform": False,
+    "object_types": FBX_OBJECT_TYPES,
+    "use_mesh_modifiers": True,
+    "use_mesh_modifiers_render": True,
+    "mesh_smooth_type": "OFF",
+    "colors_type": "SRGB",
+    "prioritize_active_color": False,
+    "use_subsurf": False,
+    "use_mesh_edges": False,
+    "use_tspace": False,
+    "use_triangles": False,
+    "use_custom_props": False,
+    "add_leaf_bones": True,
+    "primary_bone_axis": "Y",
+    "secondary_bone_axis": "X",
+    "use_armature_deform_only": False,
+    "armature_nodetype": "NULL",
+    "path_mode": "AUTO",
+    "embed_textures": False,
+    "batch_mode": "OFF",
+    "use_batch_own_dir": True,
+    "use_metadata": True,
+    "axis_forward": "-Z",
+    "axis_up": "Y",
+}
+
+ALEMBIC_EXPORT_OPTIONS = {
+    "init_scene_frame_range": True,
+    "selected": True,
+    # "collection": "",
+    "check_existing": True,
+    "filter_blender": False,
+    "filter_backup": False,
+    "filter_image": False,
+    "filter_movie": False,
+    "filter_python": False,
+    "filter_font": False,
+    "filter_sound": False,
+    "filter_text": False,
+    "filter_archive": False,
+    "filter_btx": False,
+    "filter_collada": False,
+    "filter_alembic": True,
+    "filter_usd": False,
+    "filter_obj": False,
+    "filter_volume": False,
+    "filter_folder": True,
+    "filter_blenlib": False,
+    "filemode": 8,
+    "display_type": "DEFAULT",
+    "sort_method": "DEFAULT",
+    "filter_glob": "*.abc",
+    "xsamples": 1,
+    "gsamples": 1,
+    "sh_open": 0.0,
+    "sh_close": 1.0,
+    "visible_objects_only": False,
+    "flatten": False,
+    "uvs": True,
+    "packuv": True,
+    "normals": True,
+    "vcolors": False,
+    "orcos": True,
+    "face_sets": False,
+    "subdiv_schema": False,
+    "apply_subdiv": False,
+    "curves_as_mesh": False,
+    "use_instancing": True,
+    "global_scale": 1.0,
+    "triangulate": False,
+    "quad_method": "SHORTEST_DIAGONAL",
+    "ngon_method": "BEAUTY",
+    "export_hair": True,
+    "export_particles": True,
+    "export_custom_properties": True,
+    "as_background_job": False,
+    "evaluation_mode": "RENDER",
+}
+
+USD_EXPORT_OPTIONS = {
+    "selected_objects_only": True,
+    "export_animation": True,
+    # "frame_start": frameStart,
+    # "frame_end": frameEnd,
+    "check_existing": True,
+    "filter_blender": False,
+    "filter_backup": False,
+    "filter_image": False,
+    "filter_movie": False,
+    "filter_python": False,
+    "filter_font": False,
+    "filter_sound": False,
+    "filter_text": False,
+    "filter_archive": False,
+    "filter_btx": False,
+    "filter_collada": False,
+    "filter_alembic": False,
+    "filter_usd": True,
+    "filter_obj": False,
+    "filter_volume": False,
+    "filter_folder": True,
+    "filter_blenlib": False,
+    "filemode": 8,
+    "display_type": "DEFAULT",
+    "sort_method": "DEFAULT",
+    "filter_glob": "*.usda",
+    "visible_objects_only": True,
+    # "collection": "",
+    "export_hair": True,
+    "export_uvmaps": True,
+    # "rename_uvmaps": True,
+    "export_mesh_colors": True,
+    "export_normals": True,
+    "export_materials": True,
+    # "export_subdivision": "BEST_MATCH",
+    # "export_armatures": True,
+    # "only_deform_bones": False,
+    # "export_shapekeys": True,
+    "use_instancing": False,
+    "evaluation_mode": "RENDER",
+    "generate_preview_surface": True,
+    # "generate_materialx_network": False,
+    # "convert_orientation": False,
+    # "export_global_forward_selection": "NEGATIVE_Z",
+    # "export_global_up_selection": "Y",
+    "export_textures": True,
+    "overwrite_textures": False,
+    "relative_paths": True,
+    # "xform_op_mode": "TRS",
+    "root_prim_path": "",
+    # "export_custom_properties": True,
+    # "custom_properties_namespace": "userProperties",
+    # "author_blender_name": True,
+    # "convert_world_material": True,
+    # "allow_unicode": False,
+    # "export_meshes": True,
+    # "export_lights": True,
+    # "export_cameras": True,
+    # "export_curves": True,
+    # "export_volumes": True,
+    # "triangulate_meshes": False,
+    # "quad_method": "SHORTEST_DIAGONAL",
+    # "ngon_method": "BEAUTY",
+    # "usdz_downscale_size": "KEEP",
+    # "usdz_downscale_custom_size": 128,
+}
+
 
 def loadPlugins():
     """Load specified plugins into Blender.
@@ -29,8 +208,6 @@ def loadPlugins():
 
     """
 
-    import bpy
-
     # List of addon names to load
     plugins = list()
     # Addons example ["pose_library", "io_shape_mdd", "rigify", "add_camera_rigs", "animation_add_corrective_shape_key", "object_skinify",]
@@ -70,18 +247,23 @@ def setStartup(*args, **kwargs):
     return True
 
 
-def openScene(filepath, **kwargs):
+def openScene(filepath, force=False, **kwargs):
     """Open a Blender scene file.
 
     Args:
         filepath (str): The path to the .blend file to open.
+        force (bool): Reopen the file even if it is already the current scene.
         **kwargs: Additional parameters to modify the opening behavior.
 
     Returns:
         bool: True if the scene is opened successfully, None otherwise.
     """
 
-    import bpy
+    # Skip re-reading the file from disk when it is already open
+    if not force and bpy.data.filepath:
+        currentPath = os.path.normcase(os.path.abspath(bpy.data.filepath))
+        if os.path.normcase(os.path.abspath(filepath)) == currentPath:
+            return True
 
     # Parameters for opening the scene file
     parameter = {
@@ -105,6 +287,29 @@ def openScene(filepath, **kwargs):
     return True
 
 
+def getNameMatcher(nodeNames):
+    """Build a case-insensitive substring matcher for the node names.
+
+    Small name lists are tested with plain substring checks, larger ones are
+    joined into a single precompiled alternation so each name is scanned once.
+
+    Args:
+        nodeNames (list): List of node names to search for.
+
+    Returns:
+        callable: Takes a lowered name, returns True if it contains any of the node names.
+    """
+
+    needles = sorted({name.lower() for name in nodeNames})
+
+    if len(needles) > 8:
+        pattern = re.compile("|".join(re.escape(needle) for needle in needles))
+        return lambda name: pattern.search(name) is not None
+
+    needles = tuple(needles)
+    return lambda name: any(needle in name for needle in needles)
+
+
 def getNodes(**kwargs):
     """Retrieve nodes from the current Blender scene.
 
@@ -121,30 +326,24 @@ def getNodes(**kwargs):
     nodeNames = kwargs.get("nodeNames")
     defaultNodes = kwargs.get("defaultNodes")
 
-    import bpy
+    # Nothing to match, skip the scene traversal
+    if not nodeNames:
+        return []
 
     # Get the active scene collection
     sceneCollection = bpy.context.scene.collection
 
-    nodes = list()
-
-    # Check all objects in the scene for matching node names
-    for object in sceneCollection.all_objects:
-        for name in nodeNames:
-            if name.lower() not in object.name.lower():
-                continue
-            # Add matching object name to the list
-            nodes.append(object.name)
-            break
-
-    # Check child collections for matching node names
-    for collection in sceneCollection.children_recursive:
-        for name in nodeNames:
-            if name.lower() not in collection.name.lower():
-                continue
-            # Add matching collection name to the list
-            nodes.append(collection.name)
-            break
+    # Lower the search names once instead of per scene item
+    matches = getNameMatcher(nodeNames)
+
+    # Names of the view layer objects followed by the scene child collections, in one pass
+    names = chain(
+        (object.name for object in bpy.context.view_layer.objects),
+        (collection.name for collection in sceneCollection.children_recursive),
+    )
+
+    # Keep the names matching any of the node names
+    nodes = [name for name in names if matches(name.lower())]
 
     # Return the list of found node names
     return nodes
@@ -157,56 +356,151 @@ def getFrameRange():
         tuple: A tuple containing the start and end frame numbers.
     """
 
-    import bpy
+    # Resolve the scene once, frame_start and frame_end are already integers
+    scene = bpy.context.scene
 
     frameRange = (
-        int(bpy.context.scene.frame_start),  # Get the starting frame
-        int(bpy.context.scene.frame_end),  # Get the ending frame
+        scene.frame_start,  # Get the starting frame
+        scene.frame_end,  # Get the ending frame
     )
 
     # Return the frame range as a tuple
     return frameRange
 
 
+def getLocalPath(localPath):
+    """Resolve the export directory once, as an absolute forward slash path.
+
+    Args:
+        localPath (str): The directory to save the cache files.
+
+    Returns:
+        str: The absolute local path with forward slashes.
+    """
+
+    return os.path.abspath(localPath).replace("\\", "/")
+
+
+def getExportFilepath(localPath, filename, extention):
+    """Build the export file path inside a resolved local path.
+
+    Args:
+        localPath (str): The directory resolved by getLocalPath.
+        filename (str): The name of the file (without extension).
+        extention (str): The file extension.
+
+    Returns:
+        str: The export file path with forward slashes.
+    """
+
+    return f"{localPath.rstrip('/')}/{filename}.{extention}"
+
+
 def getCameraTransforms():
     """Retrieve the names of all camera objects in the current scene.
 
     Returns:
-        list: List of camera object names.
+        frozenset: Set of camera object names, for constant time membership tests.
     """
 
-    import bpy
-
-    # Create a list of camera names in the scene
-    cameraList = [object.name for object in bpy.context.scene.objects if object.type == "CAMERA"]
+    # Create a set of camera names in the scene
+    cameraList = frozenset(
+        object.name for object in bpy.context.scene.objects if object.type == "CAMERA"
+    )
 
-    # Return the list of camera names
+    # Return the set of camera names
     return cameraList
 
 
-def getNodeName(name):
+def getSceneMaps():
+    """Build name to datablock lookups of the current scene.
+
+    Build this once per export and pass it to getNodeName/getObjects (and the
+    export functions) so each node does not repeat the datablock lookups.
+
+    Returns:
+        dict: {
+            "objects": {name: object},
+            "collections": {name: collection},
+            "children": {parent name: [child objects]},
+        }
+    """
+
+    sceneMaps = {
+        "objects": dict(),
+        "collections": {
+            collection.name: collection
+            for collection in bpy.context.scene.collection.children_recursive
+        },
+        "children": dict(),
+    }
+
+    # Single pass over the scene objects, bucketing each object under its parent name
+    for object in bpy.context.scene.objects:
+        sceneMaps["objects"][object.name] = object
+        if object.parent:
+            sceneMaps["children"].setdefault(object.parent.name, []).append(object)
+
+    # Return the name lookups
+    return sceneMaps
+
+
+def getCollection(name, sceneMaps=None):
+    """Get a collection by name, from the scene maps when available.
+
+    Args:
+        name (str): The name of the collection.
+        sceneMaps (dict, optional): Lookups returned by getSceneMaps.
+
+    Returns:
+        bpy.types.Collection or None: The collection if found.
+    """
+
+    if sceneMaps and name in sceneMaps["collections"]:
+        return sceneMaps["collections"][name]
+
+    return bpy.data.collections.get(name)
+
+
+def getObject(name, sceneMaps=None):
+    """Get an object by name, from the scene maps when available.
+
+    Args:
+        name (str): The name of the object.
+        sceneMaps (dict, optional): Lookups returned by getSceneMaps.
+
+    Returns:
+        bpy.types.Object or None: The object if found.
+    """
+
+    if sceneMaps and name in sceneMaps["objects"]:
+        return sceneMaps["objects"][name]
+
+    return bpy.context.scene.objects.get(name)
+
+
+def getNodeName(name, sceneMaps=None):
     """Get the node name from the collection or object.
 
     Args:
         name (str): The name of the node to find.
+        sceneMaps (dict, optional): Lookups returned by getSceneMaps.
 
     Returns:
         str or None: The node name with periods replaced by underscores, or None if not found.
     """
 
-    import bpy
-
     # Try to get the collection
-    result = bpy.data.collections.get(name)
+    result = getCollection(name, sceneMaps=sceneMaps)
 
     # If the collection doesn't exist, try to get the object
     if not result:
         # Get the object from the collection
-        result = bpy.data.objects.get(name)
+        result = getObject(name, sceneMaps=sceneMaps)
 
     if not result:
         # Log a warning if not found
-        LOGGER.warning("Could not found %s." % name)
+        LOGGER.warning(f"Could not found {name}.")
         return None  # Return None if neither collection nor object is found
 
     # Format the node name for consistency
@@ -220,30 +514,52 @@ def getNodeName(name):
     return nodeName
 
 
-def getObjects(name):
+def getObjects(name, sceneMaps=None):
     """Get all objects in a specified collection or a single object.
 
     Args:
         name (str): The name of the collection or object.
+        sceneMaps (dict, optional): Lookups returned by getSceneMaps.
 
     Returns:
         list: List of objects in the collection or the specified object with its children.
     """
 
-    import bpy
-
     # Get the collection by name
-    collection = bpy.data.collections.get(name)
+    collection = getCollection(name, sceneMaps=sceneMaps)
 
     if collection:
         # Return all objects in the collection
         return collection.all_objects
 
     # Try to get the object by name
-    object = bpy.data.objects.get(name)
+    object = getObject(name, sceneMaps=sceneMaps)
+
+    if not sceneMaps:
+        # Return the object and its children
+        return [object] + object.children_recursive
+
+    # Walk the prebuilt children map instead of children_recursive, which scans bpy.data.objects
+    objects = [object]
+    queue = deque([object.name])
+    while queue:
+        children = sceneMaps["children"].get(queue.popleft(), [])
+        objects.extend(children)
+        queue.extend(child.name for child in children)
 
     # Return the object and its children
-    return [object] + object.children_recursive
+    return objects
+
+
+def deselectObjects():
+    """Deselect the currently selected objects in Blender.
+
+    Only the selected objects are touched, directly through RNA, instead of
+    running the select_all operator over the whole scene.
+    """
+
+    for object in list(bpy.context.view_layer.objects.selected):
+        object.select_set(False)
 
 
 def selectObject(objects):
@@ -253,101 +569,70 @@ def selectObject(objects):
         objects (list): List of object names or Blender objects to select.
     """
 
-    import bpy
-
     # Deselect all objects
-    bpy.ops.object.select_all(action="DESELECT")
+    deselectObjects()
 
+    object = None
     for object in objects:
         if isinstance(object, str):
             # Get the object by name if a string
-            object = bpy.data.objects.get(object)
-
-        # Set the object as active
-        bpy.context.view_layer.objects.active = object
+            object = getObject(object)
 
         # Select the object
         object.select_set(True)
 
+    # Set the last object as active
+    if object:
+        bpy.context.view_layer.objects.active = object
+
 
-def exportFbx(localPath, filename, node, frameStart, frameEnd):
+def exportFbx(
+    localPath,
+    filename,
+    node,
+    frameStart,
+    frameEnd,
+    sceneMaps=None,
+    objects=None,
+    selected=False,
+):
     """Export selected objects to an FBX file.
 
     Args:
-        localPath (str): The directory to save the FBX file.
+        localPath (str): The directory to save the FBX file (resolved by getLocalPath).
         filename (str): The name of the FBX file (without extension).
         node (str): The name of the node to export.
         frameStart (int): The start frame for the animation.
         frameEnd (int): The end frame for the animation.
+        sceneMaps (dict, optional): Lookups returned by getSceneMaps.
+        objects (list, optional): Objects of the node, as returned by getObjects.
+        selected (bool, optional): The node objects are already selected by the caller,
+            so the selection is left untouched.
 
     Returns:
         dict: A dictionary containing the export file path, node, and frame range.
     """
 
-    import bpy
-
     # File extension for FBX
     extention = "fbx"
 
     # Construct the full file path for the FBX export
-    filepath = os.path.abspath(os.path.join(localPath, "%s.%s" % (filename, extention))).replace(
-        "\\", "/"
-    )
+    filepath = getExportFilepath(localPath, filename, extention)
 
-    # Get objects to export based on the specified node
-    objects = getObjects(node)
+    # Select the objects for export, unless the caller already did
+    if not selected:
+        # Get objects to export based on the specified node
+        if objects is None:
+            objects = getObjects(node, sceneMaps=sceneMaps)
 
-    # Select the objects for export
-    selectObject(objects)
+        selectObject(objects)
 
     # Perform the FBX export operation with specified settings
-    fbxExport = bpy.ops.export_scene.fbx(
-        filepath=filepath,
-        use_selection=True,
-        bake_anim=True,
-        bake_anim_use_all_bones=True,
-        bake_anim_use_nla_strips=True,
-        bake_anim_use_all_actions=True,
-        bake_anim_force_startend_keying=True,
-        bake_anim_step=1.0,
-        bake_anim_simplify_factor=1.0,
-        check_existing=True,
-        filter_glob="*.fbx",
-        use_visible=False,
-        use_active_collection=False,
-        # collection="",
-        global_scale=1.0,
-        apply_unit_scale=True,
-        apply_scale_options="FBX_SCALE_NONE",
-        use_space_transform=True,
-        bake_space_transform=False,
-        object_types={"ARMATURE", "CAMERA", "EMPTY", "LIGHT", "MESH", "OTHER"},
-        use_mesh_modifiers=True,
-        use_mesh_modifiers_render=True,
-        mesh_smooth_type="OFF",
-        colors_type="SRGB",
-        prioritize_active_color=False,
-        use_subsurf=False,
-        use_mesh_edges=False,
-        use_tspace=False,
-        use_triangles=False,
-        use_custom_props=False,
-        add_leaf_bones=True,
-        primary_bone_axis="Y",
-        secondary_bone_axis="X",
-        use_armature_deform_only=False,
-        armature_nodetype="NULL",
-        path_mode="AUTO",
-        embed_textures=False,
-        batch_mode="OFF",
-        use_batch_own_dir=True,
-        use_metadata=True,
-        axis_forward="-Z",
-        axis_up="Y",
-    )
+    fbxExport = bpy.ops.export_scene.fbx(filepath=filepath, **FBX_EXPORT_OPTIONS)
 
-    # Deselect all objects after the export
-    bpy.ops.object.select_all(action="DESELECT")
+    # Deselect all objects after the export, unless the caller owns the selection
+    if not selected:
+        deselectObjects()
 
     # Check if the export operation was successful
     if "FINISHED" not in fbxExport:
@@ -365,99 +650,59 @@ def exportFbx(localPath, filename, node, frameStart, frameEnd):
     return result
 
 
-def exportAlembic(localPath, filename, node, frameStart, frameEnd):
+def exportAlembic(
+    localPath,
+    filename,
+    node,
+    frameStart,
+    frameEnd,
+    sceneMaps=None,
+    objects=None,
+    selected=False,
+):
     """Export selected objects to an Alembic file.
 
     This function exports the specified node's selected objects into an Alembic
     file format (.abc) for animation or rendering purposes.
 
     Args:
-        localPath (str): The directory to save the Alembic file.
+        localPath (str): The directory to save the Alembic file (resolved by getLocalPath).
         filename (str): The name of the Alembic file (without extension).
         node (str): The name of the node to export.
         frameStart (int): The start frame for the animation.
         frameEnd (int): The end frame for the animation.
+        sceneMaps (dict, optional): Lookups returned by getSceneMaps.
+        objects (list, optional): Objects of the node, as returned by getObjects.
+        selected (bool, optional): The node objects are already selected by the caller,
+            so the selection is left untouched.
 
     Returns:
         dict: A dictionary containing the export file path, node, and frame range.
               Returns an empty dictionary if the export fails.
     """
 
-    import bpy
-
     # File extension for Alembic
     extention = "abc"
 
     # Construct the full file path for the Alembic export
-    filepath = os.path.abspath(os.path.join(localPath, "%s.%s" % (filename, extention))).replace(
-        "\\", "/"
-    )
+    filepath = getExportFilepath(localPath, filename, extention)
 
-    # Get objects to export based on the specified node
-    objects = getObjects(node)
+    # Select the objects for export, unless the caller already did
+    if not selected:
+        # Get objects to export based on the specified node
+        if objects is None:
+            objects = getObjects(node, sceneMaps=sceneMaps)
 
-    # Select the objects for export
-    selectObject(objects)
+        selectObject(objects)
 
     # Perform the Alembic export operation with specified settings
     alembicExport = bpy.ops.wm.alembic_export(
-        filepath=filepath,
-        start=frameStart,
-        end=frameEnd,
-        init_scene_frame_range=True,
-        selected=True,
-        # collection="",
-        check_existing=True,
-        filter_blender=False,
-        filter_backup=False,
-        filter_image=False,
-        filter_movie=False,
-        filter_python=False,
-        filter_font=False,
-        filter_sound=False,
-        filter_text=False,
-        filter_archive=False,
-        filter_btx=False,
-        filter_collada=False,
-        filter_alembic=True,
-        filter_usd=False,
-        filter_obj=False,
-        filter_volume=False,
-        filter_folder=True,
-        filter_blenlib=False,
-        filemode=8,
-        display_type="DEFAULT",
-        sort_method="DEFAULT",
-        filter_glob="*.abc",
-        xsamples=1,
-        gsamples=1,
-        sh_open=0.0,
-        sh_close=1.0,
-        visible_objects_only=False,
-        flatten=False,
-        uvs=True,
-        packuv=True,
-        normals=True,
-        vcolors=False,
-        orcos=True,
-        face_sets=False,
-        subdiv_schema=False,
-        apply_subdiv=False,
-        curves_as_mesh=False,
-        use_instancing=True,
-        global_scale=1.0,
-        triangulate=False,
-        quad_method="SHORTEST_DIAGONAL",
-        ngon_method="BEAUTY",
-        export_hair=True,
-        export_particles=True,
-        export_custom_properties=True,
-        as_background_job=False,
-        evaluation_mode="RENDER",
+        filepath=filepath, start=frameStart, end=frameEnd, **ALEMBIC_EXPORT_OPTIONS
     )
 
-    # Deselect all objects after the export
-    bpy.ops.object.select_all(action="DESELECT")
+    # Deselect all objects after the export, unless the caller owns the selection
+    if not selected:
+        deselectObjects()
 
     # Check if the export operation was successful
     if "FINISHED" not in alembicExport:
@@ -471,112 +716,57 @@ def exportAlembic(localPath, filename, node, frameStart, frameEnd):
     return result
 
 
-def exportUsd(localPath, filename, node, frameStart, frameEnd):
+def exportUsd(
+    localPath,
+    filename,
+    node,
+    frameStart,
+    frameEnd,
+    sceneMaps=None,
+    objects=None,
+    selected=False,
+):
     """Export selected objects to a USD file.
 
     This function exports the specified node's selected objects into a USD file
     format (.usda) for use in various 3D applications.
 
     Args:
-        localPath (str): The directory to save the USD file.
+        localPath (str): The directory to save the USD file (resolved by getLocalPath).
         filename (str): The name of the USD file (without extension).
         node (str): The name of the node to export.
         frameStart (int): The start frame for the animation.
         frameEnd (int): The end frame for the animation.
+        sceneMaps (dict, optional): Lookups returned by getSceneMaps.
+        objects (list, optional): Objects of the node, as returned by getObjects.
+        selected (bool, optional): The node objects are already selected by the caller,
+            so the selection is left untouched.
 
     Returns:
         dict: A dictionary containing the export file path, node, and frame range.
               Returns an empty dictionary if the export fails.
     """
 
-    import bpy
-
     # File extension for USD
     extention = "usda"
 
     # Construct the full file path for the USD export
-    filepath = os.path.abspath(os.path.join(localPath, "%s.%s" % (filename, extention))).replace(
-        "\\", "/"
-    )
+    filepath = getExportFilepath(localPath, filename, extention)
 
-    # Get objects to export based on the specified node
-    objects = getObjects(node)
+    # Select the objects for export, unless the caller already did
+    if not selected:
+        # Get objects to export based on the specified node
+        if objects is None:
+            objects = getObjects(node, sceneMaps=sceneMaps)
 
-    # Select the objects for export
-    selectObject(objects)
+        selectObject(objects)
 
     # Perform the USD export operation with specified settings
-    usdExport = bpy.ops.wm.usd_export(
-        filepath=filepath,
-        selected_objects_only=True,
-        export_animation=True,
-        # frame_start=frameStart,
-        # frame_end=frameEnd,
-        check_existing=True,
-        filter_blender=False,
-        filter_backup=False,
-        filter_image=False,
-        filter_movie=False,
-        filter_python=False,
-        filter_font=False,
-        filter_sound=False,
-        filter_text=False,
-        filter_archive=False,
-        filter_btx=False,
-        filter_collada=False,
-        filter_alembic=False,
-        filter_usd=True,
-        filter_obj=False,
-        filter_volume=False,
-        filter_folder=True,
-        filter_blenlib=False,
-        filemode=8,
-        display_type="DEFAULT",
-        sort_method="DEFAULT",
-        filter_glob="*.usda",
-        visible_objects_only=True,
-        # collection="",
-        export_hair=True,
-        export_uvmaps=True,
-        # rename_uvmaps=True,
-        export_mesh_colors=True,
-        export_normals=True,
-        export_materials=True,
-        # export_subdivision="BEST_MATCH",
-        # export_armatures=True,
-        # only_deform_bones=False,
-        # export_shapekeys=True,
-        use_instancing=False,
-        evaluation_mode="RENDER",
-        generate_preview_surface=True,
-        # generate_materialx_network=False,
-        # convert_orientation=False,
-        # export_global_forward_selection="NEGATIVE_Z",
-        # export_global_up_selection="Y",
-        export_textures=True,
-        overwrite_textures=False,
-        relative_paths=True,
-        # xform_op_mode="TRS",
-        root_prim_path="",
-        # export_custom_properties=True,
-        # custom_properties_namespace="userProperties",
-        # author_blender_name=True,
-        # convert_world_material=True,
-        # allow_unicode=False,
-        # export_meshes=True,
-        # export_lights=True,
-        # export_cameras=True,
-        # export_curves=True,
-        # export_volumes=True,
-        # triangulate_meshes=False,
-        # quad_method="SHORTEST_DIAGONAL",
-        # ngon_method="BEAUTY",
-        # usdz_downscale_size="KEEP",
-        # usdz_downscale_custom_size=128,
-    )
+    usdExport = bpy.ops.wm.usd_export(filepath=filepath, **USD_EXPORT_OPTIONS)
 
-    # Deselect all objects after the export
-    bpy.ops.object.select_all(action="DESELECT")
+    # Deselect all objects after the export, unless the caller owns the selection
+    if not selected:
+        deselectObjects()
 
     # Check if the export operation was successful
     if "FINISHED" not in usdExport:
@@ -584,8 +774,8 @@ def exportUsd(localPath, filename, node, frameStart, frameEnd):
         return dict()
 
     # Rename the file from .usda to .usd
-    newfilepath = os.path.abspath("%s.usd" % os.path.splitext(filepath)[0]).replace("\\", "/")
-    os.rename(filepath, newfilepath)
+    newfilepath = getExportFilepath(localPath, filename, "usd")
+    os.replace(filepath, newfilepath)
 
     # Prepare the result with file path, node name, and frame range
     result = {"filepath": newfilepath, "node": node, "frameRange": (frameStart, frameEnd)}
@@ -6,30 +6,90 @@
 from __future__ import absolute_import
 
 import os
+import re
+
+try:
+    from maya import cmds
+    from maya import OpenMaya
+except ImportError:
+    # Allow importing this module outside of Maya
+    cmds = OpenMaya = None
+
+
+# Static USD export parameters, the frame range and stride are added per export
+USD_EXPORT_PARAMETERS = {
+    "exportUVs": 1,
+    "exportSkels": "none",
+    "exportSkin": "none",
+    "exportBlendShapes": 0,
+    "exportDisplayColor": 0,
+    "exportColorSets": 1,
+    "exportComponentTags": 1,
+    "defaultMeshScheme": "catmullClark",
+    "animation": 1,
+    "eulerFilter": 1,
+    "staticSingleSample": 0,
+    "frameSample": 0.0,  # Frame sampling rate
+    "defaultUSDFormat": "usda",  # USD file format
+    "parentScope": "",
+    "shadingMode": "useRegistry",
+    "convertMaterialsTo": [],
+    "exportRelativeTextures": "automatic",
+    "exportInstances": 1,
+    "exportVisibility": 1,
+    "mergeTransformAndShape": 1,
+    "stripNamespaces": 0,
+    "worldspace": 0,
+}
+
+# Combine export parameters once into the string format expected by Maya
+USD_EXPORT_OPTIONS = ";".join(["%s=%s" % (k, v) for k, v in USD_EXPORT_PARAMETERS.items()])
+
+
+# Maya plugins needed by the exporters
+MAYA_PLUGINS = ["AbcExport", "fbxmaya", "mayaUsdPlugin"]
+
+# Plugins confirmed loaded in this session
+LOADED_PLUGINS = set()
+
+
+def loadPlugin(plugin):
+    """Load a plugin into maya unless it is already loaded.
+
+    Args:
+        plugin (str): The name of the plugin to load.
+
+    Returns:
+        bool: True if the plugin is loaded, False otherwise.
+    """
+
+    if plugin in LOADED_PLUGINS:
+        return True
+
+    try:
+        # Only attempt to load the plugin when maya does not have it yet
+        if not cmds.pluginInfo(plugin, query=True, loaded=True):
+            cmds.loadPlugin(plugin, quiet=True)
+            OpenMaya.MGlobal.displayInfo("Success, plug-in loaded %s" % plugin)
+    except Exception as error:
+        # Log any errors during loading
+        OpenMaya.MGlobal.displayWarning(str(error))
+        return False
+
+    LOADED_PLUGINS.add(plugin)
+    return True
 
 
 def loadPlugins():
     """Load specified plugins into maya.
 
-    This function enables the plugins defined in the `plugins` list.
+    This function enables the plugins defined in the `MAYA_PLUGINS` list.
     Any errors during loading will be logged as warnings.
 
     """
 
-    from maya import cmds
-    from maya import OpenMaya
-
-    # List of addon names to load
-    mayaPlugins = ["AbcExport", "fbxmaya", "mayaUsdPlugin"]
-
-    for plugin in mayaPlugins:
-        try:
-            # Attempt to enable the plugin
-            cmds.loadPlugin(plugin)
-            OpenMaya.MGlobal.displayInfo("Success, plug-in loaded %s" % plugin)
-        except Exception as error:
-            # Log any errors during loading
-            OpenMaya.MGlobal.displayWarning(str(error))
+    for plugin in MAYA_PLUGINS:
+        loadPlugin(plugin)
 
 
 def setStartup(*args, **kwargs):
@@ -53,8 +113,6 @@ def setStartup(*args, **kwargs):
     angle = kwargs.get("angle")
     time = kwargs.get("time")
 
-    from maya import cmds
-
     cmds.upAxis(axis=axis)
     cmds.currentUnit(linear=unit, angle=angle, time=time)
 
@@ -73,8 +131,6 @@ def openScene(filepath, **kwargs):
         bool: True if the scene is opened successfully, None otherwise.
     """
 
-    from maya import cmds
-
     # Parameters for opening the scene file
     parameter = {"open": True, "force": True, "ignoreVersion": True}
     # Update parameters with any additional kwargs
@@ -104,46 +160,54 @@ def getNodes(**kwargs):
     nodeNames = kwargs.get("nodeNames")
     defaultNodes = kwargs.get("defaultNodes")
 
-    from maya import cmds
+    # Nothing to match, skip the scene queries
+    if not nodeNames:
+        return []
 
-    topLevelNodes = cmds.ls(assemblies=True, long=True)
+    # Bind the maya commands once for the scene loop
+    ls = cmds.ls
+    getAttr = cmds.getAttr
+    listRelatives = cmds.listRelatives
+
+    # One case-insensitive alternation, walked once per scene node
+    pattern = re.compile("|".join(re.escape(name) for name in nodeNames), re.IGNORECASE)
+    defaultNodes = frozenset(defaultNodes or ())  # Constant time default node checks
+
+    # Query the top level nodes with their types in one call, as [node, type, node, type, ...]
+    typedNodes = ls(assemblies=True, long=True, showType=True)
+    topLevelNodes = [
+        node
+        for node, typeName in zip(typedNodes[0::2], typedNodes[1::2])
+        if typeName == "transform" and node not in defaultNodes
+    ]
 
     nodes = list()
+    nodeSet = set()  # Mirrors nodes for constant time membership checks
     for node in topLevelNodes:
-        if cmds.nodeType(node) != "transform":
-            continue
-        if node in defaultNodes:
+        if not getAttr("%s.visibility" % node):
             continue
 
-        if not cmds.getAttr("%s.visibility" % node):
-            continue
+        if pattern.search(node) and node not in nodeSet:
+            nodes.append(node)
+            nodeSet.add(node)
 
-        for cacheName in nodeNames:
-            if cacheName.lower() in node.lower():
-                if node in nodes:
-                    continue
-                nodes.append(node)
-                break
+        # The assembly itself is cached, its children are not needed
+        if node in nodeSet:
+            continue
 
-        children = cmds.listRelatives(node, children=True, fullPath=True, type="transform")
+        children = listRelatives(node, children=True, fullPath=True, type="transform")
 
         if not children:
             continue
 
-        for child in children:
-            for cacheName in nodeNames:
-                if cacheName.lower() in child.lower():
-                    break
-            else:
-                child = None
-
-        if not child:
-            continue
+        # Stop at the first matching child
+        child = next((child for child in children if pattern.search(child)), None)
 
-        if node in nodes:
+        if not child or child in nodeSet:
             continue
 
         nodes.append(child)
+        nodeSet.add(child)
 
     return nodes
 
@@ -155,8 +219,6 @@ def getFrameRange():
         tuple: A tuple containing the start and end frame numbers.
     """
 
-    from maya import cmds
-
     frameRange = (
         int(cmds.playbackOptions(query=True, animationStartTime=True)),  # Get the starting frame
         int(cmds.playbackOptions(query=True, animationEndTime=True)),  # Get the ending frame
@@ -166,6 +228,34 @@ def getFrameRange():
     return frameRange
 
 
+def getLocalPath(localPath):
+    """Resolve the export directory once, as an absolute forward slash path.
+
+    Args:
+        localPath (str): The directory to save the cache files.
+
+    Returns:
+        str: The absolute local path with forward slashes.
+    """
+
+    return os.path.abspath(localPath).replace("\\", "/")
+
+
+def getExportFilepath(localPath, filename, extention):
+    """Build the export file path inside a resolved local path.
+
+    Args:
+        localPath (str): The directory resolved by getLocalPath.
+        filename (str): The name of the file (without extension).
+        extention (str): The file extension.
+
+    Returns:
+        str: The export file path with forward slashes.
+    """
+
+    return "%s/%s.%s" % (localPath.rstrip("/"), filename, extention)
+
+
 def getCameraTransforms():
     """Retrieve the names of all camera objects in the current scene.
 
@@ -173,11 +263,14 @@ def getCameraTransforms():
         list: List of camera object names.
     """
 
-    from maya import mel
-    from maya import cmds
+    # Query the camera shapes directly, instead of running listTransforms through MEL
+    cameraShapes = cmds.ls(type="camera", long=True)
 
-    # Create a list of camera names in the scene
-    cameraList = cmds.ls(mel.eval("listTransforms -cameras"), long=True)
+    if not cameraShapes:
+        return []
+
+    # Create a list of the camera transform names in the scene
+    cameraList = cmds.listRelatives(cameraShapes, parent=True, fullPath=True) or []
 
     # Return the list of camera names
     return cameraList
@@ -198,54 +291,84 @@ def getNodeName(longName):
                      or None if the node does not exist in the scene.
     """
 
-    from maya import cmds
-    from maya import OpenMaya
+    # Retrieve the short name of the node (without any hierarchical paths),
+    # ls returns an empty list when the node does not exist in the scene
+    shortNames = cmds.ls(longName, shortNames=True)
 
-    # Check if the specified node exists in the scene
-    if not cmds.objExists(longName):
+    if not shortNames:
         # Display a warning in Maya if the node is not found
         OpenMaya.MGlobal.displayWarning("Could not found %s." % longName)
         # Return None if the node does not exist
         return None
 
-    # Retrieve the short name of the node (without any hierarchical paths)
-    nodeName = cmds.ls(longName, shortNames=True)[0]
-
-    # Check if the node name contains any namespaces (indicated by ":")
-    if ":" in nodeName:
-        # Strip namespaces by splitting at ":" and keeping only the base name
-        nodeName = nodeName.rsplit(":", nodeName.count(":"))[0]
+    # Strip namespaces (indicated by ":") by keeping only the base name
+    nodeName = shortNames[0].rsplit(":", 1)[-1]
 
     # Return the processed node name without namespaces
     return nodeName
 
 
-def exportFbx(localPath, filename, node, frameStart, frameEnd):
+def selectNode(node):
+    """Replace the active selection with a node through the API, skipping cmds.select.
+
+    Args:
+        node (str): The name of the node to select.
+    """
+
+    selection = OpenMaya.MSelectionList()
+    selection.add(node)
+    OpenMaya.MGlobal.setActiveSelectionList(selection, OpenMaya.MGlobal.kReplaceList)
+
+
+def getSelection():
+    """Get the current selection, to restore it after a batch of exports.
+
+    Returns:
+        list: Long names of the selected nodes.
+    """
+
+    return cmds.ls(selection=True, long=True) or []
+
+
+def setSelection(nodes):
+    """Restore a selection saved by getSelection.
+
+    Args:
+        nodes (list): Names of the nodes to select, clears the selection when empty.
+    """
+
+    if nodes:
+        cmds.select(nodes, replace=True)
+    else:
+        cmds.select(clear=True)
+
+
+def exportFbx(localPath, filename, node, frameStart, frameEnd, clearSelection=True):
     """Export selected objects to an FBX file.
 
     Args:
-        localPath (str): The directory to save the FBX file.
+        localPath (str): The directory to save the FBX file (resolved by getLocalPath).
         filename (str): The name of the FBX file (without extension).
         node (str): The name of the node to export.
         frameStart (int): The start frame for the animation.
         frameEnd (int): The end frame for the animation.
+        clearSelection (bool, optional): Clear the selection after the export.
 
     Returns:
         dict: A dictionary containing the export file path, node, and frame range.
     """
 
-    from maya import cmds
+    # Load the FBX plugin on the first FBX export
+    loadPlugin("fbxmaya")
 
     # File extension for FBX
     extention = "fbx"
 
     # Construct the full file path for the FBX export
-    filepath = os.path.abspath(os.path.join(localPath, "%s.%s" % (filename, extention))).replace(
-        "\\", "/"
-    )
+    filepath = getExportFilepath(localPath, filename, extention)
 
     # Select the objects for export
-    cmds.select(node, replace=True)
+    selectNode(node)
 
     # Perform the FBX export operation with specified settings
     cmds.file(
@@ -257,8 +380,9 @@ def exportFbx(localPath, filename, node, frameStart, frameEnd):
         exportSelected=True,
     )
 
-    # Deselect all objects after the export
-    cmds.select(clear=True)
+    # Deselect all objects after the export, unless the caller restores the selection
+    if clearSelection:
+        cmds.select(clear=True)
 
     # Prepare the result with file path, node name, and frame range
     result = {
@@ -271,6 +395,42 @@ def exportFbx(localPath, filename, node, frameStart, frameEnd):
     return result
 
 
+def getAlembicJob(localPath, filename, node, frameStart, frameEnd):
+    """Build the AbcExport job arguments for one node.
+
+    Args:
+        localPath (str): The directory to save the Alembic file (resolved by getLocalPath).
+        filename (str): The name of the Alembic file (without extension).
+        node (str): The name of the node to export.
+        frameStart (int): The start frame for the animation.
+        frameEnd (int): The end frame for the animation.
+
+    Returns:
+        tuple: The job arguments string and the export file path.
+    """
+
+    # File extension for Alembic
+    extention = "abc"
+
+    # Construct the full file path for the Alembic export
+    filepath = getExportFilepath(localPath, filename, extention)
+
+    # Define attributes to include in export, such as metadata
+    attributes = " -attr metadata"
+
+    # Construct the job arguments of the AbcExport command
+    job = "-frameRange %s %s %s -stripNamespaces -uvWrite -worldSpace -dataFormat %s -root %s -file %s" % (
+        frameStart,
+        frameEnd,
+        attributes,
+        "ogawa",
+        node,
+        filepath,
+    )
+
+    return job, filepath
+
+
 def exportAlembic(localPath, filename, node, frameStart, frameEnd):
     """Export selected objects to an Alembic file.
 
@@ -278,7 +438,7 @@ def exportAlembic(localPath, filename, node, frameStart, frameEnd):
     file format (.abc) for animation or rendering purposes.
 
     Args:
-        localPath (str): The directory to save the Alembic file.
+        localPath (str): The directory to save the Alembic file (resolved by getLocalPath).
         filename (str): The name of the Alembic file (without extension).
         node (str): The name of the node to export.
         frameStart (int): The start frame for the animation.
@@ -289,107 +449,85 @@ def exportAlembic(localPath, filename, node, frameStart, frameEnd):
               Returns an empty dictionary if the export fails.
     """
 
-    from maya import OpenMaya
+    return exportAlembicBatch([(localPath, filename, node, frameStart, frameEnd)])[0]
 
-    # File extension for Alembic
-    extention = "abc"
 
-    # Construct the full file path for the Alembic export
-    filepath = os.path.abspath(os.path.join(localPath, "%s.%s" % (filename, extention))).replace(
-        "\\", "/"
-    )
+def exportAlembicBatch(jobs):
+    """Export several nodes to Alembic files with a single AbcExport call.
 
-    # Define attributes to include in export, such as metadata
-    attributes = " -attr metadata"
+    Every node gets its own jobArg, so Maya walks the timeline once for all of them.
 
-    # Construct the MEL command for Alembic export
-    melCommand = (
-        'AbcExport -j "-frameRange %s %s %s -stripNamespaces -uvWrite -worldSpace -dataFormat %s -root %s -file %s";'
-        % (
-            frameStart,
-            frameEnd,
-            attributes,
-            "ogawa",
-            node,
-            filepath,
-        )
-    )
+    Args:
+        jobs (list): Tuples of (localPath, filename, node, frameStart, frameEnd),
+            as taken by exportAlembic.
 
-    # Display the constructed export command as a warning in Maya for debugging
-    OpenMaya.MGlobal.displayWarning("export command: %s" % melCommand)
+    Returns:
+        list: A result dictionary per job, in the jobs order, with the export
+              file path, node, and frame range.
+    """
 
-    # Execute the MEL command to perform the export
-    OpenMaya.MGlobal.executeCommand(melCommand, True, True)
+    if not jobs:
+        return []
 
-    # Prepare the result with file path, node name, and frame range
-    result = {"filepath": filepath, "node": node, "frameRange": (frameStart, frameEnd)}
+    # Load the Alembic plugin on the first Alembic export
+    loadPlugin("AbcExport")
 
-    # Return the result of the export
-    return result
+    jobArguments = list()
+    results = list()
+    for localPath, filename, node, frameStart, frameEnd in jobs:
+        job, filepath = getAlembicJob(localPath, filename, node, frameStart, frameEnd)
+        jobArguments.append(job)
+
+        # Prepare the result with file path, node name, and frame range
+        results.append({"filepath": filepath, "node": node, "frameRange": (frameStart, frameEnd)})
+
+    # Display the export jobs as a warning in Maya for debugging
+    OpenMaya.MGlobal.displayWarning("export jobs: %s" % jobArguments)
 
+    # Run every job through the AbcExport command directly, without MEL parsing
+    cmds.AbcExport(jobArg=jobArguments)
 
-def exportUsd(localPath, filename, node, frameStart, frameEnd):
+    # Return the results of the exports
+    return results
+
+
+def exportUsd(localPath, filename, node, frameStart, frameEnd, clearSelection=True):
     """Export selected objects to a USD file.
 
     This function exports the specified node's selected objects into a USD file
     format (.usda) for use in various 3D applications.
 
     Args:
-        localPath (str): The directory to save the USD file.
+        localPath (str): The directory to save the USD file (resolved by getLocalPath).
         filename (str): The name of the USD file (without extension).
         node (str): The name of the node to export.
         frameStart (int): The start frame for the animation.
         frameEnd (int): The end frame for the animation.
+        clearSelection (bool, optional): Clear the selection after the export.
 
     Returns:
         dict: A dictionary containing the export file path, node, and frame range.
               Returns an empty dictionary if the export fails.
     """
 
-    from maya import cmds
+    # Load the USD plugin on the first USD export
+    loadPlugin("mayaUsdPlugin")
 
     # File extension for USD
     extention = "usd"
 
-    # Define export parameters for USD with detailed settings
-    parameters = {
-        "exportUVs": 1,
-        "exportSkels": "none",
-        "exportSkin": "none",
-        "exportBlendShapes": 0,
-        "exportDisplayColor": 0,
-        "exportColorSets": 1,
-        "exportComponentTags": 1,
-        "defaultMeshScheme": "catmullClark",
-        "animation": 1,
-        "eulerFilter": 1,
-        "staticSingleSample": 0,
-        "startTime": 1001,  # Start frame for export
-        "endTime": 1046,  # End frame for export
-        "frameStride": 1,  # Step between frames
-        "frameSample": 0.0,  # Frame sampling rate
-        "defaultUSDFormat": "usda",  # USD file format
-        "parentScope": "",
-        "shadingMode": "useRegistry",
-        "convertMaterialsTo": [],
-        "exportRelativeTextures": "automatic",
-        "exportInstances": 1,
-        "exportVisibility": 1,
-        "mergeTransformAndShape": 1,
-        "stripNamespaces": 0,
-        "worldspace": 0,
-    }
-
-    # Combine export parameters into a string format expected by Maya
-    options = ";".join(["%s=%s" % (k, v) for k, v in parameters.items()])
+    # Combine the static export options with the frame range of this export
+    options = "%s;startTime=%s;endTime=%s;frameStride=1" % (
+        USD_EXPORT_OPTIONS,
+        frameStart,
+        frameEnd,
+    )
 
     # Construct the full file path for the USD export
-    filepath = os.path.abspath(os.path.join(localPath, "%s.%s" % (filename, extention))).replace(
-        "\\", "/"
-    )
+    filepath = getExportFilepath(localPath, filename, extention)
 
     # Select the objects for export
-    cmds.select(node, replace=True)
+    selectNode(node)
 
     # Execute the export command, with options to preserve references and force overwrite
     cmds.file(
@@ -401,8 +539,9 @@ def exportUsd(localPath, filename, node, frameStart, frameEnd):
         exportSelected=True,
     )
 
-    # Deselect all objects after the export
-    cmds.select(clear=True)
+    # Deselect all objects after the export, unless the caller restores the selection
+    if clearSelection:
+        cmds.select(clear=True)
 
     # Prepare the result with file path, node name, and frame range
     result = {"filepath": filepath, "node": node, "frameRange": (frameStart, frameEnd)}
@@ -5,8 +5,6 @@
 
 from __future__ import absolute_import
 
-import qdarktheme
-
 import resources
 
 from PySide2 import QtGui
@@ -17,49 +15,133 @@ from kore import utils
 from kore import constant
 
 
+# Loaded pixmaps and icons by name, Qt shares their data between copies
+PIXMAP_CACHE = dict()
+PIXMAP_ICON_CACHE = dict()
+
+# Images decoded off the GUI thread by prewarmPixmaps, turned into pixmaps on first use
+IMAGE_CACHE = dict()
+
+# Generated stylesheets by theme name
+STYLESHEET_CACHE = dict()
+
+# Fonts by size, family and bold, Qt shares their data between copies
+FONT_CACHE = dict()
+
+
 class PixmapIcon(QtGui.QIcon):
     def __init__(self, name, **kwargs):
+        cached = PIXMAP_ICON_CACHE.get(name)
+        if cached is not None:
+            super(PixmapIcon, self).__init__(cached)
+            return
+
         super(PixmapIcon, self).__init__()
 
         pixmap = Pixmap(name)
         self.addPixmap(pixmap, QtGui.QIcon.Normal, QtGui.QIcon.Off)
 
+        if not pixmap.isNull():
+            PIXMAP_ICON_CACHE[name] = QtGui.QIcon(self)
+
 
 class Pixmap(QtGui.QPixmap):
     def __init__(self, name, **kwargs):
+        cached = PIXMAP_CACHE.get(name)
+        if cached is not None:
+            super(Pixmap, self).__init__(cached)
+            self.name = name
+            return
+
         super(Pixmap, self).__init__()
 
         self.name = name
 
-        if constant.LOAD_FROM_DATA:
+        image = IMAGE_CACHE.pop(name, None)
+        if image is not None:
+            self.convertFromImage(image)
+        elif constant.LOAD_FROM_DATA:
             imageData = resources.getIconData(self.name)
             self.loadFromData(imageData)
         else:
             iconpath = resources.getIconFilepath(self.name)
             self.load(iconpath)
 
+        if not self.isNull():
+            PIXMAP_CACHE[name] = QtGui.QPixmap(self)
+
+
+class ImageLoader(QtCore.QRunnable):
+    def __init__(self, names):
+        super(ImageLoader, self).__init__()
+
+        self.names = names
+
+        self.setAutoDelete(True)
+
+    def run(self):
+        for name in self.names:
+            if name in PIXMAP_CACHE or name in IMAGE_CACHE:
+                continue
+
+            # QPixmap belongs to the GUI thread, a QImage can be decoded here
+            image = QtGui.QImage()
+            if constant.LOAD_FROM_DATA:
+                image.loadFromData(resources.getIconData(name))
+            else:
+                image.load(resources.getIconFilepath(name))
+
+            if not image.isNull():
+                IMAGE_CACHE[name] = image
+
+
+def prewarmPixmaps(names):
+    """Decode the given images on the global thread pool, ahead of their Pixmap.
+
+    Args:
+        names (list): The icon names.
+    """
+
+    QtCore.QThreadPool.globalInstance().start(ImageLoader(list(names)))
+
 
 class Font(QtGui.QFont):
     def __init__(self, size, **kwargs):
-        super(Font, self).__init__()
-
         family = kwargs.get("family")
         bold = kwargs.get("bold") or False
 
+        key = (size, family, bold)
+        cached = FONT_CACHE.get(key)
+        if cached is not None:
+            super(Font, self).__init__(cached)
+            return
+
+        super(Font, self).__init__()
+
         self.setPointSize(size)
         self.setBold(bold)
 
         if family:
             self.setFamily(family)
 
+        FONT_CACHE[key] = QtGui.QFont(self)
+
 
 class SetStylesheet(object):
     def __init__(self, parent, **kwargs):
         super(SetStylesheet, self).__init__()
 
-        theme = kwargs.get("theme") or constant.constant.GUI_THEMES[0]
+        theme = kwargs.get("theme") or constant.GUI_THEMES[0]
+
+        stylesheet = STYLESHEET_CACHE.get(theme)
+        if stylesheet is None:
+            import qdarktheme
+
+            stylesheet = STYLESHEET_CACHE[theme] = qdarktheme.load_stylesheet(theme)
 
-        parent.setStyleSheet(qdarktheme.load_stylesheet(theme))
+        # Re-applying an unchanged stylesheet would still re-polish every child widget
+        if parent.styleSheet() != stylesheet:
+            parent.setStyleSheet(stylesheet)
 
 
 class SplashScreen(QtWidgets.QSplashScreen):
@@ -5,6 +5,8 @@
 
 from __future__ import absolute_import
 
+import logging
+
 import resources
 
 from PySide2 import QtGui
@@ -30,8 +32,8 @@ class IconButton(QtWidgets.QPushButton):
         self.__parent__ = parent
 
         self.name = kwargs.get("name") or self.name
-        self.width = kwargs.get("width") or self.width
-        self.height = kwargs.get("height") or self.height
+        self.width = kwargs.get("width", self.width)
+        self.height = kwargs.get("height", self.height)
         self.locked = False if kwargs.get("locked") == False else True
         self.flat = kwargs.get("flat") if "flat" in kwargs else True
 
@@ -39,11 +41,12 @@ class IconButton(QtWidgets.QPushButton):
 
         icon = PixmapIcon(self.name)
         self.setIcon(icon)
-        self.setIconSize(QtCore.QSize(self.width, self.height))
+        size = QtCore.QSize(self.width, self.height)
+        self.setIconSize(size)
 
         if self.locked:
-            self.setMinimumSize(QtCore.QSize(self.width, self.height))
-            self.setMaximumSize(QtCore.QSize(self.width, self.height))
+            self.setMinimumSize(size)
+            self.setMaximumSize(size)
 
 
 class BrowsePathButton(IconButton):
@@ -56,17 +59,24 @@ class BrowsePathButton(IconButton):
         self.browsepath = kwargs.get("browsepath") or resources.getOrbitPath()
         self.widget = kwargs.get("widget")
 
+        self.fileDialog = None  # Created on the first browse, then reused
+
         self.clicked.connect(self.findFile)
 
     def findFile(self):
-        fileDialog = QtWidgets.QFileDialog(self.__parent__)
+        if self.fileDialog is None:
+            self.fileDialog = QtWidgets.QFileDialog(self.__parent__, "Browse your file")
+            self.fileDialog.setFileMode(QtWidgets.QFileDialog.Directory)
+            self.fileDialog.setOptions(
+                QtWidgets.QFileDialog.ShowDirsOnly | QtWidgets.QFileDialog.DontResolveSymlinks
+            )
 
-        directory = fileDialog.getExistingDirectory(
-            self.__parent__,
-            "Browse your file",
-            self.browsepath,
-            QtWidgets.QFileDialog.ShowDirsOnly | QtWidgets.QFileDialog.DontResolveSymlinks,
-        )
+        self.fileDialog.setDirectory(self.browsepath)
+
+        if not self.fileDialog.exec_():
+            return
+
+        directory = self.fileDialog.selectedFiles()[0]
 
         if not directory:
             return
@@ -91,18 +101,20 @@ class ProjectSaveButton(IconButton):
         self.clicked.connect(self.save)
 
     def save(self):
-        if not self.__parent__.hasValid():
+        parent = self.__parent__
+
+        if not parent.hasValid():
             QtWidgets.QMessageBox.warning(
-                self.__parent__,
+                parent,
                 "Warning",
                 "Invalid project path, update the project path and try!..",
                 QtWidgets.QMessageBox.Cancel,
             )
             return
 
-        utils.writeJsonFile(self.__parent__.presetContext, self.__parent__.presetsFilePath)
+        utils.writeJsonFile(parent.presetContext, parent.presetsFilePath)
         LOGGER.info(
-            "Succeed, to save your project settings ( %s )" % self.__parent__.presetsFilePath
+            "Succeed, to save your project settings ( %s )" % parent.presetsFilePath
         )
 
         QtWidgets.QMessageBox.information(
@@ -122,26 +134,35 @@ class CacheSaveButton(IconButton):
         self.clicked.connect(self.save)
 
     def save(self):
-        if not hasattr(self.__parent__, "widgetItem"):
+        parent = self.__parent__
+
+        if not hasattr(parent, "widgetItem"):
             return
 
-        values = self.__parent__.getValues()
+        # The saved version and local path must match the codes being saved
+        parent.flushVersionPath()
 
-        self.__parent__.widgetItem.setContext(values, append=True)
+        values = parent.getValues()
 
-        LOGGER.info("Saved your item property")
-        for k, v in values.items():
-            LOGGER.info("%s: %s" % (k, v))
+        widgetItem = parent.widgetItem
+        widgetItem.setContext(values, append=True)
+
+        # One record for all the properties, formatted only if INFO is enabled
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(
+                "Saved your item property\n%s",
+                "\n".join("%s: %s" % (k, v) for k, v in values.items()),
+            )
 
-        self.__parent__.widgetItem.context["save"] = True
+        widgetItem.context["save"] = True
 
-        for lineedit, label in self.__parent__.inputWidgets:
+        for lineedit, label in parent.inputWidgets:
             if lineedit.value is None:
                 label.setEditColor()
             else:
                 label.setSavedColor()
 
-        self.__parent__.updateVersionPath()
+        parent.updateVersionPath()
 
 
 class ClearButton(IconButton):
@@ -4,7 +4,7 @@
 
 from __future__ import absolute_import
 
-from functools import partial
+import logging
 
 import resources
 
@@ -40,6 +40,11 @@ LOGGER = logger.getLogger(__name__)
 
 
 class NormalGroup(QtWidgets.QGroupBox):
+    # Shared by every group, setSizePolicy stores its own copy
+    groupSizePolicy = QtWidgets.QSizePolicy(
+        QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred
+    )
+
     def __init__(self, parent, title, **kwargs):
         super(NormalGroup, self).__init__(parent, title)
         self.__parent__ = parent
@@ -50,10 +55,7 @@ class NormalGroup(QtWidgets.QGroupBox):
 
         self.setFlat(True)
 
-        sizepolicy = QtWidgets.QSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred
-        )
-        self.setSizePolicy(sizepolicy)
+        self.setSizePolicy(self.groupSizePolicy)
 
 
 class ProjectGroup(NormalGroup):
@@ -64,7 +66,9 @@ class ProjectGroup(NormalGroup):
         self.context = dict()
         self.presetContext = dict()
 
-        self.validExtensions = list()
+        # Source file extensions and their first project context, read per dropped file
+        self.validExtensions = set()
+        self.contextsByExtension = dict()
 
         self.presetsFilePath = resources.getProjectPresetsPath()
         self.projectContextList = self.getPresetContextList()
@@ -74,11 +78,14 @@ class ProjectGroup(NormalGroup):
         self.gridlayout.setVerticalSpacing(10)
         self.gridlayout.setContentsMargins(20, 20, 20, 20)
 
+        # Hold the repaints until every project row is in the layout
+        self.setUpdatesEnabled(False)
+
         for context in self.projectContextList:
             label = RightLabel(self, label=context["label"])
             self.gridlayout.addWidget(label, context["index"], 0, 1, 1)
 
-            lineedit = ProjectLineEdit(self)
+            lineedit = ProjectLineEdit(self, key=context["key"])
             lineedit.setContext(context)
             lineedit.setValue(value=None)
             self.gridlayout.addWidget(lineedit, context["index"], 1, 1, 1)
@@ -87,20 +94,25 @@ class ProjectGroup(NormalGroup):
             self.gridlayout.addWidget(button, context["index"], 2, 1, 1)
 
             if context.get("extensions"):
-                self.validExtensions.extend(context["extensions"])
+                self.validExtensions.update(context["extensions"])
+                for extension in context["extensions"]:
+                    self.contextsByExtension.setdefault(extension, context)
 
         self.projectSaveButton = ProjectSaveButton(self)
         self.gridlayout.addWidget(self.projectSaveButton, len(self.projectContextList), 2, 1, 1)
 
+        self.setUpdatesEnabled(True)
+
     def getPresetContextList(self):
-        localPresetsContext = utils.readJsonFile(self.presetsFilePath)
+        localPresetsContext = utils.readCachedJsonFile(self.presetsFilePath)
 
-        projectContextList = constant.PROJECT_CONTEXT_LIST.copy()
+        projectContextList = list()
 
-        for context in projectContextList:
-            if context["key"] not in localPresetsContext:
-                continue
-            context["value"] = localPresetsContext[context["key"]]
+        for context in constant.PROJECT_CONTEXT_LIST:
+            # Only the contexts with a preset value are copied, the others are shared
+            if context["key"] in localPresetsContext:
+                context = dict(context, value=localPresetsContext[context["key"]])
+            projectContextList.append(context)
 
         return projectContextList
 
@@ -110,6 +122,7 @@ class ProjectGroup(NormalGroup):
             return False
         return utils.isPath(projectPath)
 
+    @QtCore.Slot()
     def setProject(self):
         if not hasattr(self.__parent__, "cachePropertyPage"):
             return
@@ -123,6 +136,8 @@ class NormalPage(QtWidgets.QWidget):
 
 
 class CachePropertyPage(NormalPage):
+    inputMaximumSize = QtCore.QSize(200, 16777215)  # Shared by every input widget
+
     def __init__(self, parent, **kwargs):
         super(CachePropertyPage, self).__init__(parent)
 
@@ -133,7 +148,35 @@ class CachePropertyPage(NormalPage):
         self.projectPath = None
         self.displayLogs = False
         self.diaplayMessageBox = False
-        self.codeList = [None for _ in range(4)]
+        self.codeList = [None] * 4
+        self.built = False  # The child widgets are built on the first show or use
+        self.holdVersionPath = False  # Set while setValues loads many inputs at once
+        self.versionSequence = 0  # Counts the version path requests, see applyNextVersion
+        self.versionRequest = None  # Task path and item of the pending request, None once applied
+
+        # Main window widgets and pools, bound once through bindMainWidgets
+        self.projectGroup = None
+        self.fileTreewidget = None
+        self.threadReadPool = None
+        self.threadCachePool = None
+
+    def bindMainWidgets(self, projectGroup, fileTreewidget, threadReadPool, threadCachePool):
+        self.projectGroup = projectGroup
+        self.fileTreewidget = fileTreewidget
+        self.threadReadPool = threadReadPool
+        self.threadCachePool = threadCachePool
+
+    def showEvent(self, event):
+        self.buildUi()
+        super(CachePropertyPage, self).showEvent(event)
+
+    def buildUi(self):
+        if self.built:
+            return
+        self.built = True
+
+        # Hold the repaints until every widget is in the layout
+        self.setUpdatesEnabled(False)
 
         self.gridlayout = QtWidgets.QGridLayout(self)
         self.gridlayout.setHorizontalSpacing(10)
@@ -150,7 +193,7 @@ class CachePropertyPage(NormalPage):
             self,
             key="show",
             editable=False,
-            maximumSize=QtCore.QSize(200, 16777215),
+            maximumSize=self.inputMaximumSize,
             labelWidget=self.showLabel,
         )
         self.showLineedit.setEnabled(False)
@@ -170,7 +213,7 @@ class CachePropertyPage(NormalPage):
             index=0,
             editable=True,
             modelList=constant.KINDS,
-            maximumSize=QtCore.QSize(200, 16777215),
+            maximumSize=self.inputMaximumSize,
             labelWidget=self.kindLabel,
         )
         self.gridlayout.addWidget(self.kindLineedit, 2, 1, 1, 1)
@@ -184,7 +227,7 @@ class CachePropertyPage(NormalPage):
             index=1,
             editable=True,
             modelList=constant.SEQUENCES,
-            maximumSize=QtCore.QSize(200, 16777215),
+            maximumSize=self.inputMaximumSize,
             labelWidget=self.sequenceLabel,
         )
         self.gridlayout.addWidget(self.sequenceLineedit, 3, 1, 1, 1)
@@ -198,7 +241,7 @@ class CachePropertyPage(NormalPage):
             index=2,
             editable=True,
             modelList=constant.SHOTS,
-            maximumSize=QtCore.QSize(200, 16777215),
+            maximumSize=self.inputMaximumSize,
             labelWidget=self.shotLabel,
         )
         self.gridlayout.addWidget(self.shotLineedit, 4, 1, 1, 1)
@@ -213,7 +256,7 @@ class CachePropertyPage(NormalPage):
             editable=True,
             default=constant.TASKS[0],
             modelList=constant.TASKS,
-            maximumSize=QtCore.QSize(200, 16777215),
+            maximumSize=self.inputMaximumSize,
             labelWidget=self.taskLabel,
         )
         self.codeList[3] = constant.TASKS[0]
@@ -228,7 +271,7 @@ class CachePropertyPage(NormalPage):
             editable=True,
             minimum=1,
             maximum=999999999,
-            maximumSize=QtCore.QSize(200, 16777215),
+            maximumSize=self.inputMaximumSize,
             default=constant.DEFAULT_FRAME_START,
             labelWidget=self.fstartLabel,
         )
@@ -243,7 +286,7 @@ class CachePropertyPage(NormalPage):
             editable=True,
             minimum=1,
             maximum=999999999,
-            maximumSize=QtCore.QSize(200, 16777215),
+            maximumSize=self.inputMaximumSize,
             default=constant.DEFAULT_FRAME_END,
             labelWidget=self.fendLabel,
         )
@@ -258,7 +301,7 @@ class CachePropertyPage(NormalPage):
             index=4,
             editable=True,
             default=constant.DEFAULT_VERSION,
-            maximumSize=QtCore.QSize(200, 16777215),
+            maximumSize=self.inputMaximumSize,
         )
         self.versionLineedit.setEnabled(True)
         self.gridlayout.addWidget(self.versionLineedit, 8, 1, 1, 1)
@@ -307,56 +350,101 @@ class CachePropertyPage(NormalPage):
         self.gridlayout.addWidget(self.cachesaveButton, 12, 3, 1, 1)
 
         self.cacheButton = CacheButton(self)
-        self.cacheButton.clicked.connect(partial(self.cacheIt, diaplayMessageBox=True))
+        self.cacheButton.clicked.connect(self.cacheClicked)
         self.gridlayout.addWidget(self.cacheButton, 13, 1, 1, 2)
 
-        self.inputWidgets = [
-            [self.showLineedit, self.showLabel],
-            [self.kindLineedit, self.kindLabel],
-            [self.sequenceLineedit, self.sequenceLabel],
-            [self.shotLineedit, self.shotLabel],
-            [self.taskLineedit, self.taskLabel],
-            [self.fstartSpinBox, self.fstartLabel],
-            [self.fendSpinBox, self.fendLabel],
-            [self.versionLineedit, self.versionLabel],
-            [self.localpathLineedit, self.localpathLabel],
-            [self.cameraCheckBox, self.cameraLabel],
-            [self.cacheCombobox, self.cacheLabel],
-        ]
+        self.inputWidgets = (
+            (self.showLineedit, self.showLabel),
+            (self.kindLineedit, self.kindLabel),
+            (self.sequenceLineedit, self.sequenceLabel),
+            (self.shotLineedit, self.shotLabel),
+            (self.taskLineedit, self.taskLabel),
+            (self.fstartSpinBox, self.fstartLabel),
+            (self.fendSpinBox, self.fendLabel),
+            (self.versionLineedit, self.versionLabel),
+            (self.localpathLineedit, self.localpathLabel),
+            (self.cameraCheckBox, self.cameraLabel),
+            (self.cacheCombobox, self.cacheLabel),
+        )
+
+        # Value key and editable state of every input, resolved once
+        self.inputEntries = tuple(
+            (widget, label, widget.key, widget.hasEditable()) for widget, label in self.inputWidgets
+        )
+        self.editableInputs = tuple(entry[0] for entry in self.inputEntries if entry[3])
+        self.inputsByKey = {widget.key: (widget, label) for widget, label in self.inputWidgets}
+
+        if self.projectPath:
+            self.showLineedit.setValue(utils.folderName(self.projectPath))
+
+        self.setUpdatesEnabled(True)
 
     def setProject(self, value):
+        if value == self.projectPath:
+            return  # The show name is already up to date
         self.projectPath = value
+        if not self.built:
+            return  # Applied by buildUi
         self.showLineedit.setValue(utils.folderName(value))
 
     def updateVersionPath(self):
+        if self.holdVersionPath:
+            return  # setValues updates the version path once it is done
+
+        self.buildUi()
+
         if None in self.codeList[1:]:
+            self.cancelVersionPath()  # A scan for the previous codes must not land here
             LOGGER.warning("Detected None in the codeList %s" % self.codeList)
             return
 
         taskPath = utils.pathResolver(
-            self.__parent__.projectGroup.presetContext["projectPath"],
-            folders=self.codeList,
+            self.projectGroup.presetContext["projectPath"], folders=self.codeList
         )
 
-        nextVersion = utils.nextVersion(taskPath)
+        # Scan the task directory on the read pool, only the latest request is applied
+        self.versionSequence += 1
+        self.versionRequest = (taskPath, self.widgetItem)  # The version path appends the version
+
+        versionRunner = thread.WorkerVersionRunner(utils.nextVersion, self.versionSequence, taskPath)
+        versionRunner.signals.finished.connect(self.applyNextVersion)
+
+        self.threadReadPool.start(versionRunner)
+
+    def cancelVersionPath(self):
+        # Any scan still running is dropped by applyNextVersion
+        self.versionSequence += 1
+        self.versionRequest = None
+
+    def hasPendingVersion(self):
+        return self.versionRequest is not None
+
+    def flushVersionPath(self):
+        # Save and cache read the form, a pending request is scanned here instead of waited on
+        if not self.hasPendingVersion():
+            return
+
+        taskPath, widgetItem = self.versionRequest
+        self.applyNextVersion(self.versionSequence, utils.nextVersion(taskPath))
+
+    @QtCore.Slot(int, str)
+    def applyNextVersion(self, sequence, nextVersion):
+        if sequence != self.versionSequence or not self.hasPendingVersion():
+            return  # A newer request is on its way, or this one is cancelled or applied
+
+        taskPath, widgetItem = self.versionRequest
+        self.versionRequest = None
+
         self.versionLineedit.setValue(nextVersion)
 
-        versionPath = utils.pathResolver(
-            self.__parent__.projectGroup.presetContext["projectPath"],
-            folders=self.codeList + [nextVersion],
-        )
+        versionPath = "%s/%s" % (taskPath, nextVersion)
 
-        exists, widget_item = self.__parent__.fileTreewidget.localPathExists(
-            versionPath, widgetItem=self.widgetItem
+        exists, widget_item = self.fileTreewidget.localPathExists(
+            versionPath, widgetItem=widgetItem
         )
 
         if exists:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Warning",
-                "Already exists, %s\n(%s)" % (versionPath, widget_item.filepath),
-                QtWidgets.QMessageBox.Ok,
-            )
+            self.showWarning("Already exists, %s\n(%s)" % (versionPath, widget_item.filepath))
             self.localpathLineedit.reset()
             return
 
@@ -364,35 +452,61 @@ class CachePropertyPage(NormalPage):
         self.projectLocationButton.browsepath = versionPath
 
     def reset(self):
-        for widget, label in self.inputWidgets:
-            if not widget.hasEditable():
-                continue
+        self.cancelVersionPath()
+
+        if not self.built:
+            return  # Nothing to reset, the widgets start from their defaults
+        for widget in self.editableInputs:
             widget.reset()
 
     def setDisplayLogs(self, value):
         self.displayLogs = value
 
     def setValues(self, context):
-        for widget, label in self.inputWidgets:
-            if widget.hasEditable():
+        self.buildUi()
+
+        # The input change handlers still run, only the version path update is held
+        self.holdVersionPath = True
+        try:
+            for widget in self.editableInputs:
                 widget.reset()
-            if widget.key not in context:
-                label.setEditColor()
-                continue
-            widget.setValue(context[widget.key])
+
+            # Only the inputs with a value in the context are touched
+            for key, value in context.items():
+                entry = self.inputsByKey.get(key)
+                if entry:
+                    entry[0].setValue(value)
+
+            for key in self.inputsByKey.keys() - context.keys():
+                self.inputsByKey[key][1].setEditColor()
+        finally:
+            self.holdVersionPath = False
+
+        self.updateVersionPath()
 
     def getValues(self):
+        self.buildUi()
+
         context = dict()
 
-        for lineedit, label in self.inputWidgets:
-            context[lineedit.key] = lineedit.getValue()
+        for lineedit, label, key, editable in self.inputEntries:
+            context[key] = lineedit.getValue()
 
         return context
 
     def setWidgetItem(self, widgetItem):
         self.widgetItem = widgetItem
 
+    def showWarning(self, message):
+        QtWidgets.QMessageBox.warning(self, "Warning", message, QtWidgets.QMessageBox.Ok)
+
+    @QtCore.Slot()
+    def cacheClicked(self):
+        self.cacheIt(diaplayMessageBox=True)
+
     def cacheIt(self, diaplayMessageBox=False):
+        self.buildUi()
+
         if not self.widgetItem:
             LOGGER.warning("Load the treewidget item (select the item) and try")
             return
@@ -402,42 +516,25 @@ class CachePropertyPage(NormalPage):
             return
 
         if not self.widgetItem.hasChecked():
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Warning",
-                "Please check the unchecked items and try!..",
-                QtWidgets.QMessageBox.Ok,
-            )
-            return
+            return self.showWarning("Please check the unchecked items and try!..")
+
+        # The local path must match the codes on screen, not the codes of an earlier scan
+        self.flushVersionPath()
 
         if not self.widgetItem.context.get("save"):
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Warning",
-                "Save the current item and try!..",
-                QtWidgets.QMessageBox.Ok,
-            )
-            return
+            return self.showWarning("Save the current item and try!..")
 
         if not self.localpathLineedit.value:
-            QtWidgets.QMessageBox.warning(
-                self,
-                "Warning",
-                "Please set the publish localPath and try!..",
-                QtWidgets.QMessageBox.Ok,
-            )
-            return
+            return self.showWarning("Please set the publish localPath and try!..")
 
         self.diaplayMessageBox = diaplayMessageBox
 
         self.widgetItem.updateContext()
 
-        inputs = self.widgetItem.context.copy()
-
-        if "filepath" in inputs:
-            inputs.pop("filepath")
+        # Copy the item context without its source filepath
+        inputs = {k: v for k, v in self.widgetItem.context.items() if k != "filepath"}
 
-        inputs.update(self.__parent__.projectGroup.context)  # startupContext
+        inputs.update(self.projectGroup.context)  # startupContext
 
         self.widgetItem.setDisplay(3)  # Caching in progress
 
@@ -445,11 +542,13 @@ class CachePropertyPage(NormalPage):
             self.createCache, self.widgetItem.filepath, self.displayLogs, self.widgetItem, **inputs
         )
 
-        exportPool.signals.progress.connect(self.cacheThreadProgress)
+        # The progress handler only logs, without INFO there is nothing to deliver
+        if LOGGER.isEnabledFor(logging.INFO):
+            exportPool.signals.progress.connect(self.cacheThreadProgress)
         exportPool.signals.error.connect(self.cacheThreadError)
         exportPool.signals.finished.connect(self.cacheThreadFinished)
 
-        self.__parent__.threadCachePool.start(
+        self.threadCachePool.start(
             exportPool,
             priority=self.__parent__.priority,  # QtCore.QThread.HighestPriority
         )
@@ -462,9 +561,11 @@ class CachePropertyPage(NormalPage):
 
         logger.nextLine()
 
-        LOGGER.info("Input context")
-        for k, v in kwargs.items():
-            LOGGER.info("%s: %s" % (k, v))
+        # One record for the whole input context, formatted only if INFO is enabled
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(
+                "Input context\n%s", "\n".join("%s: %s" % (k, v) for k, v in kwargs.items())
+            )
 
         logger.nextLine()
 
@@ -473,9 +574,11 @@ class CachePropertyPage(NormalPage):
 
         return context
 
+    @QtCore.Slot(dict)
     def cacheThreadProgress(self, result):
         LOGGER.info(result)
 
+    @QtCore.Slot(dict)
     def cacheThreadFinished(self, inputs):
         widget = inputs["widget"]
         context = inputs["context"]
@@ -513,10 +616,15 @@ class CachePropertyPage(NormalPage):
         logger.nextLine()
         LOGGER.info("Result: %s" % widget.context["filepath"])
 
-        for context in context["result"]["outputs"]:
-            LOGGER.info("Cache file: %s" % context["filepath"])
-            LOGGER.info("Node: %s" % context["node"])
-            LOGGER.info("Frame range: {}".format(context["frameRange"]))
+        # One record for all the cache files, formatted only if INFO is enabled
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(
+                "\n".join(
+                    "Cache file: %s\nNode: %s\nFrame range: %s"
+                    % (output["filepath"], output["node"], output["frameRange"])
+                    for output in context["result"]["outputs"]
+                )
+            )
 
         widget.setSelected(False)
         widget.setDisplay(5)
@@ -530,6 +638,7 @@ class CachePropertyPage(NormalPage):
             )
             return
 
+    @QtCore.Slot(object)
     def cacheThreadError(self, error):
         exctype, value, traceback, widget = error
         print(exctype)
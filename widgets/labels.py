@@ -19,6 +19,80 @@ from widgets import PixmapIcon
 
 LOGGER = logger.getLogger(__name__)
 
+# Shared by the title and copyright labels, setSizePolicy stores its own copy
+FIXED_HEIGHT_POLICY = QtWidgets.QSizePolicy(
+    QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed
+)
+
+# Right and vertically centered, shared by the copyright and right labels
+RIGHT_ALIGNMENT = QtCore.Qt.AlignRight | QtCore.Qt.AlignTrailing | QtCore.Qt.AlignVCenter
+
+# Completer string lists, sets, models and completers, shared by the line edits of the same key
+COMPLETER_MODELS = dict()
+
+
+def createCompleterModel(modelList):
+    """Completer string list, its membership set, model and completer for the given items.
+
+    Args:
+        modelList (list): The completer items.
+
+    Returns:
+        tuple: The mutable string list, its set, its QStringListModel and the QCompleter.
+    """
+
+    items = list(modelList)
+    completerModel = QtCore.QStringListModel(items)
+
+    completer = QtWidgets.QCompleter()
+    completer.setModel(completerModel)
+
+    return items, set(items), completerModel, completer
+
+
+def getCompleterModel(key, modelList):
+    """Shared completer string list, set, model and completer for the given key.
+
+    The items only seed the completer of a new key, the values added later by any
+    line edit of the key are offered to all of them.
+
+    Args:
+        key (str): The line edit key, None gives a completer of its own.
+        modelList (list): The completer items.
+
+    Returns:
+        tuple: The mutable string list, its set, its QStringListModel and the QCompleter.
+    """
+
+    if key is None:
+        return createCompleterModel(modelList)
+
+    if key not in COMPLETER_MODELS:
+        COMPLETER_MODELS[key] = createCompleterModel(modelList)
+
+    return COMPLETER_MODELS[key]
+
+
+def addCompleterItem(modelList, modelSet, completerModel, value):
+    """Append a new value to the completer, the existing rows are kept as they are.
+
+    Args:
+        modelList (list): The completer string list.
+        modelSet (set): The membership set of the string list.
+        completerModel (QtCore.QStringListModel): The completer model.
+        value (str): The value to add.
+    """
+
+    if value in modelSet:
+        return
+
+    modelSet.add(value)
+    modelList.append(value)
+
+    row = completerModel.rowCount()
+    completerModel.insertRows(row, 1)
+    completerModel.setData(completerModel.index(row), value)
+
 
 class TitleLabel(QtWidgets.QLabel):
     def __init__(self, parent, name, **kwargs):
@@ -30,10 +104,7 @@ class TitleLabel(QtWidgets.QLabel):
         self.setPixmap(pixmap)
         self.setScaledContents(False)
 
-        sizePolicy = QtWidgets.QSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed
-        )
-        self.setSizePolicy(sizePolicy)
+        self.setSizePolicy(FIXED_HEIGHT_POLICY)
 
 
 class CopyrightLabel(QtWidgets.QLabel):
@@ -42,15 +113,12 @@ class CopyrightLabel(QtWidgets.QLabel):
 
         self.__parent__ = parent
 
-        sizePolicy = QtWidgets.QSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed
-        )
-        self.setSizePolicy(sizePolicy)
+        self.setSizePolicy(FIXED_HEIGHT_POLICY)
 
         font = Font(9, family="Arial", bold=True)
         self.setFont(font)
 
-        self.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignTrailing | QtCore.Qt.AlignVCenter)
+        self.setAlignment(RIGHT_ALIGNMENT)
         self.setText(constant.COPYRIGHT_LABEL)
 
 
@@ -62,7 +130,7 @@ class RightLabel(QtWidgets.QLabel):
 
         self.label = kwargs.get("label")
 
-        self.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignTrailing | QtCore.Qt.AlignVCenter)
+        self.setAlignment(RIGHT_ALIGNMENT)
         self.setText(self.label)
 
 
@@ -72,10 +140,20 @@ class InputLable(RightLabel):
 
         # self.setStyleSheet("color: rgb(255, 0, 0);")
 
+        self.edited = None  # Last applied color, every edit would restyle the label otherwise
+
     def setEditColor(self):
+        if self.edited is True:
+            return
+
+        self.edited = True
         self.setStyleSheet("color: rgb(255, 0, 0);")
 
     def setSavedColor(self):
+        if self.edited is False:
+            return
+
+        self.edited = False
         self.setStyleSheet("")
 
 
@@ -116,11 +194,9 @@ class CompleterLineEdit(NormalLineEdit):
     def __init__(self, parent, **kwargs):
         super(CompleterLineEdit, self).__init__(parent, **kwargs)
 
-        self.modelList = kwargs.get("modelList") or list()
-
-        self.completerModel = QtCore.QStringListModel(self.modelList)
-        self.completer = QtWidgets.QCompleter()
-        self.completer.setModel(self.completerModel)
+        self.modelList, self.modelSet, self.completerModel, self.completer = getCompleterModel(
+            kwargs.get("key"), kwargs.get("modelList") or list()
+        )
         self.setCompleter(self.completer)
 
         self.editingFinished.connect(self.lineEditChange)
@@ -130,10 +206,7 @@ class CompleterLineEdit(NormalLineEdit):
 
         self.value = newText
 
-        if self.value not in self.modelList:
-            self.modelList.append(self.value)
-
-        self.completerModel.setStringList(self.modelList)
+        addCompleterItem(self.modelList, self.modelSet, self.completerModel, self.value)
 
     def setValue(self, value):
         self.value = value
@@ -145,10 +218,7 @@ class CompleterLineEdit(NormalLineEdit):
             value = str(value)
 
         self.setText(value)
-        if self.value not in self.modelList:
-            self.modelList.append(self.value)
-
-        self.completerModel.setStringList(self.modelList)
+        addCompleterItem(self.modelList, self.modelSet, self.completerModel, value)
 
 
 class LocalPathLineEdit(CompleterLineEdit):
@@ -160,13 +230,17 @@ class ProjectLineEdit(NormalLineEdit):
     def __init__(self, parent, **kwargs):
         super(ProjectLineEdit, self).__init__(parent)
 
-        self.modelList = kwargs.get("modelList") or list()
-
-        self.completerModel = QtCore.QStringListModel(self.modelList)
-        self.completer = QtWidgets.QCompleter()
-        self.completer.setModel(self.completerModel)
+        self.modelList, self.modelSet, self.completerModel, self.completer = getCompleterModel(
+            kwargs.get("key"), kwargs.get("modelList") or list()
+        )
         self.setCompleter(self.completer)
 
+        # Typing a project path sets the project once it settles, not on every keystroke
+        self.projectTimer = QtCore.QTimer(self)
+        self.projectTimer.setInterval(250)
+        self.projectTimer.setSingleShot(True)
+        self.projectTimer.timeout.connect(self.__parent__.setProject)
+
         self.editingFinished.connect(self.lineEditFinished)
         self.textChanged.connect(self.lineEditChange)
 
@@ -192,17 +266,18 @@ class ProjectLineEdit(NormalLineEdit):
 
         self.__parent__.presetContext[self.key] = self.value
 
-        if self.value not in self.modelList:
-            self.modelList.append(self.value)
+        addCompleterItem(self.modelList, self.modelSet, self.completerModel, self.value)
 
-        self.completerModel.setStringList(self.modelList)
+        if self.projectTimer.isActive():
+            self.projectTimer.stop()
+            self.__parent__.setProject()
 
     def lineEditChange(self):
         self.value = self.text()
         self.__parent__.presetContext[self.key] = self.value
 
         if self.key == "projectPath":
-            self.__parent__.setProject()
+            self.projectTimer.start()
 
 
 class InputCompleterLineEdit(NormalLineEdit):
@@ -210,14 +285,19 @@ class InputCompleterLineEdit(NormalLineEdit):
         super(InputCompleterLineEdit, self).__init__(parent, **kwargs)
 
         self.default = kwargs.get("default")
-        self.modelList = kwargs.get("modelList") or list()
-
-        self.completerModel = QtCore.QStringListModel(self.modelList)
-        self.completer = QtWidgets.QCompleter()
-        self.completer.setModel(self.completerModel)
+        self.modelList, self.modelSet, self.completerModel, self.completer = getCompleterModel(
+            kwargs.get("key"), kwargs.get("modelList") or list()
+        )
         self.setCompleter(self.completer)
 
+        # Typing only restyles the label, the code and version path follow once it settles
+        self.commitTimer = QtCore.QTimer(self)
+        self.commitTimer.setInterval(150)
+        self.commitTimer.setSingleShot(True)
+        self.commitTimer.timeout.connect(self.commitText)
+
         self.textChanged.connect(self.inputTextChanged)
+        self.editingFinished.connect(self.commitText)
 
         if self.default:
             self.setValue(self.default)
@@ -232,10 +312,14 @@ class InputCompleterLineEdit(NormalLineEdit):
             value = str(value)
 
         self.setText(value)
-        if self.value not in self.modelList:
-            self.modelList.append(self.value)
+        addCompleterItem(self.modelList, self.modelSet, self.completerModel, value)
 
-        self.completerModel.setStringList(self.modelList)
+        # Programmatic values are committed right away, setValues reads the codeList next
+        self.commitText()
+
+    def reset(self):
+        super(InputCompleterLineEdit, self).reset()
+        self.commitText()
 
     def inputTextChanged(self, text):
         if self.value == text:
@@ -249,7 +333,15 @@ class InputCompleterLineEdit(NormalLineEdit):
         if hasattr(self.__parent__.widgetItem, "context"):
             self.__parent__.widgetItem.context["save"] = saved
 
-        value = text or None
+        self.commitTimer.start()
+
+    def commitText(self):
+        self.commitTimer.stop()
+
+        value = self.text() or None
+
+        if self.__parent__.codeList[self.index] == value:
+            return  # Already committed, by the timer or a programmatic value
 
         self.__parent__.codeList[self.index] = value
 
@@ -379,19 +471,33 @@ class NormalComboBox(QtWidgets.QComboBox):
 
     def setValues(self, context):
         context = context or self.context
-        self.clear()
 
+        # One pass builds the item labels and finds the current value
         values = list()
-        for x in context["values"]:
+        currentIndex = None
+        for index, x in enumerate(context["values"]):
             if isinstance(x, dict):
                 values.append("%s ( %s )" % (x["index"], x["label"]))
             else:
-                values = context["values"]
-                break
+                values.append(x)
+
+            if currentIndex is None and x == context["value"]:
+                currentIndex = index
+
+        if currentIndex is None:
+            raise ValueError("%s is not in the values" % context["value"])
+
+        # The populate is one change, not a signal per clear, add and index
+        self.blockSignals(True)
+
+        # The same items only move the current index, the list is rebuilt otherwise
+        if values != [self.itemText(index) for index in range(self.count())]:
+            self.clear()
+            self.addItems(values)
 
-        self.addItems(values)
+        self.setCurrentIndex(currentIndex)
+        self.blockSignals(False)
 
-        self.setCurrentIndex(context["values"].index(context["value"]))
         self.value = context["value"]
         self.values = context["values"]
 
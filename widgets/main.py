@@ -25,6 +25,14 @@ from widgets.treewidgets import FileTreewidget
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    # Project group and cache property page policies, setSizePolicy stores its own copy
+    projectSizePolicy = QtWidgets.QSizePolicy(
+        QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed
+    )
+    pageSizePolicy = QtWidgets.QSizePolicy(
+        QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding
+    )
+
     def __init__(self, parent=None, **kwargs):
         super(MainWindow, self).__init__(parent)
 
@@ -68,6 +76,9 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.maximize:
             self.showMaximized()
 
+        # The window can be on screen already, hold the repaints until the layout is complete
+        self.centralwidget.setUpdatesEnabled(False)
+
         self.verticallayout = QtWidgets.QVBoxLayout(self.centralwidget)
         self.verticallayout.setSpacing(5)
         self.verticallayout.setContentsMargins(10, 10, 10, 10)
@@ -98,21 +109,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self.verticallayout_panel.setContentsMargins(1, 1, 1, 1)
 
         self.projectGroup = ProjectGroup(self, title="Project Settings")
-        sizePolicy = QtWidgets.QSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed
-        )
-        self.projectGroup.setSizePolicy(sizePolicy)
+        self.projectGroup.setSizePolicy(self.projectSizePolicy)
         self.verticallayout_panel.addWidget(self.projectGroup)
 
         self.toolBox = QtWidgets.QToolBox(self)
         self.verticallayout_panel.addWidget(self.toolBox)
 
         self.cachePropertyPage = CachePropertyPage(self)
-        sizePolicy = QtWidgets.QSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding
+        self.cachePropertyPage.bindMainWidgets(
+            self.projectGroup, self.fileTreewidget, self.threadReadPool, self.threadCachePool
         )
         self.cachePropertyPage.setProject(self.projectGroup.presetContext["projectPath"])
-        self.cachePropertyPage.setSizePolicy(sizePolicy)
+        self.cachePropertyPage.setSizePolicy(self.pageSizePolicy)
 
         self.toolBox.addItem(self.cachePropertyPage, "Cache Property")
         self.cachePropertyPage.setEnabled(False)
@@ -120,22 +128,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.suppertPage = SuppertPage(self)
         self.toolBox.addItem(self.suppertPage, "Support")
 
-        self.line = QtWidgets.QFrame(self)
-        self.line.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.verticallayout.addWidget(self.line)
+        self.topLine = self.addHLine(self.verticallayout)
 
         self.copyrightLabel = CopyrightLabel(self)
         self.verticallayout.addWidget(self.copyrightLabel)
 
-        self.line = QtWidgets.QFrame(self)
-        self.line.setFrameShape(QtWidgets.QFrame.HLine)
-        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
-        self.verticallayout.addWidget(self.line)
+        self.bottomLine = self.addHLine(self.verticallayout)
 
         self.toolBox.setCurrentIndex(1)
         self.splitter.setSizes([917, 548])
 
+        self.centralwidget.setUpdatesEnabled(True)
+
+    def addHLine(self, layout):
+        line = QtWidgets.QFrame(self)
+        line.setFrameShape(QtWidgets.QFrame.HLine)
+        line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        layout.addWidget(line)
+        return line
+
     def setupIcons(self):
         icon = PixmapIcon(constant.TOOL_IOCN)
         self.setWindowIcon(icon)
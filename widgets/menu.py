@@ -4,8 +4,6 @@
 
 from __future__ import absolute_import
 
-from functools import partial
-
 import resources
 
 from PySide2 import QtGui
@@ -21,6 +19,22 @@ from widgets import SetStylesheet
 
 LOGGER = logger.getLogger(__name__)
 
+# Label, thread priority, index and tool tip of the priority menu actions
+PRIORITIES = (
+    ("Realtime", QtCore.QThread.HighestPriority, 5, "Scheduled more often than HighPriority."),
+    ("High", QtCore.QThread.HighPriority, 4, "Scheduled more often than NormalPriority."),
+    (
+        "Above Normal",
+        QtCore.QThread.NormalPriority,
+        3,
+        "The default priority of the operating system.",
+    ),
+    ("Below Normal", QtCore.QThread.LowPriority, 2, "Scheduled less often than NormalPriority."),
+    ("Low", QtCore.QThread.LowestPriority, 1, "Scheduled less often than LowPriority."),
+)
+
+FILE_FILTER = "Maya/Blender file (*.%s)" % " *.".join(constant.INPUT_EXTENTIONS)
+
 
 class ToolbarMenu(QtWidgets.QToolBar):
     def __init__(self, parent, **kwargs):
@@ -31,17 +45,18 @@ class ToolbarMenu(QtWidgets.QToolBar):
         self.logs = False
         self.saveFilepath = None
 
+        # Hold the repaints until every action and separator is on the toolbar
+        self.setUpdatesEnabled(False)
+
+        # The item actions are one group, a single separator closes it
         self.addItemAction = AddItemAction(self)
         self.addAction(self.addItemAction)
-        self.addSeparator()
 
         self.realoadtemAction = ReloadItemAction(self)
         self.addAction(self.realoadtemAction)
-        self.addSeparator()
 
         self.removeItemAction = RemoveItemAction(self)
         self.addAction(self.removeItemAction)
-        self.addSeparator()
 
         self.removeAllItemAction = RemoveAllItemAction(self)
         self.addAction(self.removeAllItemAction)
@@ -70,6 +85,8 @@ class ToolbarMenu(QtWidgets.QToolBar):
         self.helpAction = HelpAction(self)
         self.addAction(self.helpAction)
 
+        self.setUpdatesEnabled(True)
+
 
 class NormalMenu(QtWidgets.QMenu):
     label = "normal"
@@ -98,19 +115,26 @@ class CpuCountMenu(NormalMenu):
 
         self.setTearOffEnabled(True)
 
-        threadReadPool = QtCore.QThreadPool()
-        maxThreadCount = threadReadPool.maxThreadCount()
+        # The ideal thread count is what a new QThreadPool would report, without the pool
+        maxThreadCount = QtCore.QThread.idealThreadCount()
 
         self.actionList = list()
 
+        # Non exclusive, every CPU keeps its own check state
+        self.actionGroup = QtWidgets.QActionGroup(self)
+        self.actionGroup.setExclusive(False)
+
         for count in range(maxThreadCount):
             action = QtWidgets.QAction(self)
             action.setText("CPU %s" % str(count))
             action.setCheckable(True)
             action.setChecked(True)
-            self.addAction(action)
+            self.actionGroup.addAction(action)
             self.actionList.append(action)
 
+        # One call adds the actions, not a menu update per CPU
+        self.addActions(self.actionList)
+
 
 class PriorityMenu(NormalMenu):
     label = "priority"
@@ -122,47 +146,37 @@ class PriorityMenu(NormalMenu):
 
         self.setTearOffEnabled(True)
 
-        priorityList = [
-            [
-                "Realtime",
-                QtCore.QThread.HighestPriority,
-                5,
-                "Scheduled more often than HighPriority.",
-            ],
-            ["High", QtCore.QThread.HighPriority, 4, "Scheduled more often than NormalPriority."],
-            [
-                "Above Normal",
-                QtCore.QThread.NormalPriority,
-                3,
-                "The default priority of the operating system.",
-            ],
-            [
-                "Below Normal",
-                QtCore.QThread.LowPriority,
-                2,
-                "Scheduled less often than NormalPriority.",
-            ],
-            ["Low", QtCore.QThread.LowestPriority, 1, "Scheduled less often than LowPriority."],
-        ]
-
         self.actionList = list()
+        self.priorities = dict()  # Thread priority by action index
+
+        # The actions are only needed once the menu opens, the window priority is set already
+        self.aboutToShow.connect(self.buildActions)
+
+    def buildActions(self):
+        if self.actionList:
+            return
+
+        # One exclusive group unchecks the other actions and reports the triggered one
+        self.actionGroup = QtWidgets.QActionGroup(self)
+        self.actionGroup.setExclusive(True)
+        self.actionGroup.triggered.connect(self.setPriority)
 
-        for label, qthread, index, toolTip in priorityList:
+        for label, qthread, index, toolTip in PRIORITIES:
             action = QtWidgets.QAction(self)
             action.setText(label)
             action.setToolTip(toolTip)
             action.setCheckable(True)
+            action.setData(index)
+            self.actionGroup.addAction(action)
             self.addAction(action)
-            action.triggered.connect(partial(self.setPriority, action, index, qthread))
+            self.priorities[index] = qthread
             self.actionList.append(action)
 
         self.actionList[0].setChecked(True)
 
-    def setPriority(self, action, index, qthread):
-        for each in self.actionList:
-            if each == action:
-                continue
-            each.setChecked(False)
+    def setPriority(self, action):
+        index = action.data()
+        qthread = self.priorities[index]
 
         self.__parent__.__parent__.priority = qthread
         LOGGER.info("Priority change into, %s ( %s )" % (index, qthread))
@@ -194,16 +208,27 @@ class AddItemAction(NormalAction):
 
         self.browsepath = kwargs.get("browsepath") or resources.getOrbitPath()
 
+        self.fileDialog = None  # Created on the first add, then reused
+
         self.triggered.connect(self.addItem)
 
     def addItem(self):
-        fileDialog = QtWidgets.QFileDialog(self.__parent__.__parent__)
-        filepaths, format = fileDialog.getOpenFileNames(
-            self.__parent__.__parent__,
-            "Browse your source files",
-            self.browsepath,
-            "Maya/Blender file (*.%s)" % " *.".join(constant.INPUT_EXTENTIONS),
-        )
+        if self.fileDialog is None:
+            self.fileDialog = QtWidgets.QFileDialog(
+                self.__parent__.__parent__, "Browse your source files"
+            )
+            self.fileDialog.setFileMode(QtWidgets.QFileDialog.ExistingFiles)
+            self.fileDialog.setNameFilter(FILE_FILTER)
+            self.fileDialog.filesSelected.connect(self.addFiles)
+
+        self.fileDialog.setDirectory(self.browsepath)
+
+        # Opened without a nested event loop, the files are added once they are selected
+        self.fileDialog.open()
+
+    def addFiles(self, filepaths):
+        if not filepaths:
+            return
 
         self.__parent__.__parent__.fileTreewidget.addFileItems(filepaths)
 
@@ -321,15 +346,15 @@ class DisplayLoggerAction(NormalAction):
 
         self.display = False
 
+        # Both toggle icons are loaded once, setActive only swaps them
+        self.icons = {name: PixmapIcon(name) for name in ("logger-disabled", "logger-normal")}
+
         self.triggered.connect(self.displayLogger)
 
     def setActive(self, display):
         self.name = "logger-disabled" if display else "logger-normal"
 
-        self.iconpath = resources.getIconFilepath(self.name)
-
-        icon = PixmapIcon(self.name)
-        self.setIcon(icon)
+        self.setIcon(self.icons[self.name])
 
         self.display, mode = (False, "Off") if self.display else (True, "On")
 
@@ -352,10 +377,19 @@ class ThemeAction(NormalAction):
         self.themes = constant.GUI_THEMES
         self.theme = constant.GUI_THEMES[0]
 
+        # Quick toggles are applied once, an even number of them leaves the stylesheet as it is
+        self.themeTimer = QtCore.QTimer(self)
+        self.themeTimer.setInterval(50)
+        self.themeTimer.setSingleShot(True)
+        self.themeTimer.timeout.connect(self.applyTheme)
+
         self.triggered.connect(self.switchTheme)
 
     def switchTheme(self):
         self.theme = self.themes[1] if self.theme == self.themes[0] else self.themes[0]
+        self.themeTimer.start()
+
+    def applyTheme(self):
         SetStylesheet(self.__parent__.__parent__, theme=self.theme)
 
 
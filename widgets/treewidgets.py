@@ -5,6 +5,8 @@
 
 from __future__ import absolute_import
 
+import logging
+
 import resources
 
 from PySide2 import QtGui
@@ -34,6 +36,7 @@ class NormalTreewidget(QtWidgets.QTreeWidget):
         self.setHeaderHidden(True)
         self.setSortingEnabled(False)
         self.setAlternatingRowColors(True)
+        self.setUniformRowHeights(True)  # Every row holds one icon, the view skips measuring each
         self.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
 
         self.setIconSize(QtCore.QSize(self.iconSize[0], self.iconSize[1]))
@@ -50,6 +53,12 @@ class FileTreewidget(NormalTreewidget):
         self.context = dict()
         self.childItems = list()
         self.cachePropertyPage = None
+
+        # File items by source filepath and by cache local path, instead of scanning childItems
+        self.itemsByFilepath = dict()
+        self.itemsByLocalPath = dict()
+
+        self.runningCount = 0  # File items with an import or export thread
         self.displayLogs = False
 
         self.setAcceptDrops(True)
@@ -83,11 +92,8 @@ class FileTreewidget(NormalTreewidget):
         if not mimeData.hasUrls():
             return
 
-        filepaths = list()
-        for url in mimeData.urls():
-            filepaths.append(utils.pathResolver(url.toLocalFile()))
-
-        self.addFileItems(filepaths)
+        # Resolved as addFileItems walks them, the urls are only iterated once
+        self.addFileItems(utils.pathResolver(url.toLocalFile()) for url in mimeData.urls())
 
         event.acceptProposedAction()
 
@@ -96,25 +102,32 @@ class FileTreewidget(NormalTreewidget):
 
     def setChildItems(self, item):
         self.childItems.append(item)
+        self.itemsByFilepath[item.filepath] = item
 
     def hasItemExists(self, filepath):
-        context = list(filter(lambda x: x.filepath == filepath, self.childItems))
-        return True if context else False
+        return filepath in self.itemsByFilepath
 
-    def hasValuedFile(self, filepath):
-        extenstion = utils.fileExtenstion(filepath)
-        return True if extenstion in self.__parent__.projectGroup.validExtensions else False
+    def indexLocalPath(self, widgetItem, oldLocalPath, newLocalPath):
+        if oldLocalPath and widgetItem in self.itemsByLocalPath.get(oldLocalPath, ()):
+            self.itemsByLocalPath[oldLocalPath].remove(widgetItem)
+            if not self.itemsByLocalPath[oldLocalPath]:
+                del self.itemsByLocalPath[oldLocalPath]
 
-    def hasRunning(self, widgetItems=None):
-        widgetItems = widgetItems or self.childItems
+        if newLocalPath:
+            self.itemsByLocalPath.setdefault(newLocalPath, list()).append(widgetItem)
 
-        for widgetItem in widgetItems:
-            if widgetItem.hasThreading():
-                LOGGER.warning("Running, please try after completed")
-                running = True
-                break
+    def hasValuedFile(self, filepath, extenstion=None):
+        extenstion = extenstion or utils.fileExtenstion(filepath)
+        return extenstion in self.__parent__.projectGroup.validExtensions
+
+    def hasRunning(self, widgetItems=None):
+        if widgetItems:
+            running = any(widgetItem.thread for widgetItem in widgetItems)
         else:
-            running = False
+            running = self.runningCount > 0  # Kept by FileWidgetItem.setThreading
+
+        if running:
+            LOGGER.warning("Running, please try after completed")
 
         return running
 
@@ -124,11 +137,13 @@ class FileTreewidget(NormalTreewidget):
 
         parentWidgetItem = self.invisibleRootItem()
         for widgetItem in widgetItems:
-            if self.hasRunning(widgetItems=[widgetItem]):
+            if widgetItem.thread:
                 LOGGER.warning("Running, please try after completed")
                 continue
 
             self.childItems.remove(widgetItem)
+            self.itemsByFilepath.pop(widgetItem.filepath, None)
+            self.indexLocalPath(widgetItem, widgetItem.context.get("localPath"), None)
             parentWidgetItem.removeChild(widgetItem)
 
     def removeAllItems(self):
@@ -137,48 +152,64 @@ class FileTreewidget(NormalTreewidget):
 
         self.clear()
         self.childItems = list()
+        self.itemsByFilepath = dict()
+        self.itemsByLocalPath = dict()
 
-    def getProjectContext(self, filepath):
-        extenstion = utils.fileExtenstion(filepath)
+    def getProjectContext(self, filepath, extenstion=None):
+        extenstion = extenstion or utils.fileExtenstion(filepath)
 
-        projectContextList = list(
-            filter(
-                lambda x: x.get("extensions") and extenstion in x["extensions"],
-                self.__parent__.projectGroup.projectContextList,
-            )
-        )
+        projectContext = self.__parent__.projectGroup.contextsByExtension.get(extenstion)
 
-        return projectContextList[0].copy() if projectContextList else None
+        return projectContext.copy() if projectContext else None
 
     def addFileItems(self, filepaths):
         if isinstance(filepaths, str):
             filepaths = [filepaths]
 
+        # Resolve every file first, the tree only changes for the files it takes
+        projectContexts = list()
+        addedFilepaths = set()
         for filepath in filepaths:
-            if not self.hasValuedFile(filepath):
+            extenstion = utils.fileExtenstion(filepath)
+
+            if not self.hasValuedFile(filepath, extenstion=extenstion):
                 LOGGER.warning("Invalid file format, %s" % filepath)
                 continue
 
-            if self.hasItemExists(filepath):
+            if self.hasItemExists(filepath) or filepath in addedFilepaths:
                 LOGGER.warning("Already exists, %s" % filepath)
                 continue
 
-            projectContext = self.getProjectContext(filepath)
+            addedFilepaths.add(filepath)
+            projectContexts.append(
+                (filepath, self.getProjectContext(filepath, extenstion=extenstion))
+            )
 
+        if not projectContexts:
+            return
+
+        self.setUpdatesEnabled(False)
+
+        for filepath, projectContext in projectContexts:
             fileWidgetItem = FileWidgetItem(self, projectContext["name"], filepath)
             fileWidgetItem.setContext(projectContext, append=False)
 
             self.importItem(fileWidgetItem)
             self.setChildItems(fileWidgetItem)
 
+        self.setUpdatesEnabled(True)
+
     def importItem(self, widgetItem):
         widgetItem.setDisplay(1)
         widgetItem.setThreading(True)
 
-        inputs = widgetItem.context.copy()
-
+        # Unpacking already hands the runner its own dict, the item context is not copied first
         fileReadWorker = thread.WorkerImportRunner(
-            self.importSourceFile, widgetItem.filepath, self.displayLogs, widgetItem, **inputs
+            self.importSourceFile,
+            widgetItem.filepath,
+            self.displayLogs,
+            widgetItem,
+            **widgetItem.context
         )
         fileReadWorker.signals.progress.connect(self.importThreadProgress)
         fileReadWorker.signals.error.connect(self.importThreadError)
@@ -191,15 +222,17 @@ class FileTreewidget(NormalTreewidget):
 
     def importSourceFile(self, filepath, *args, **kwargs):
         logger.nextLine()
-        LOGGER.info("Started import %s file" % kwargs["name"])
-        LOGGER.info("Current priority, %s" % self.__parent__.priority)
-        LOGGER.info("Source filepath, %s" % filepath)
 
-        logger.nextLine()
-
-        LOGGER.info("Input context")
-        for k, v in kwargs.items():
-            LOGGER.info("%s: %s" % (k, v))
+        # One record per file, the import threads share the handler lock
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(
+                "Started import %s file\nCurrent priority, %s\nSource filepath, %s\n\n"
+                "Input context\n%s",
+                kwargs["name"],
+                self.__parent__.priority,
+                filepath,
+                "\n".join("%s: %s" % (k, v) for k, v in kwargs.items()),
+            )
 
         logger.nextLine()
 
@@ -240,17 +273,25 @@ class FileTreewidget(NormalTreewidget):
 
         widget.setContext(context, append=True)
 
+        self.setUpdatesEnabled(False)
+
+        # A reload replaces the node items, the stale ones would stay in childItems otherwise
         if widget.childItems:
-            for child in widget.childItems:
-                widget.removeChild(child)
+            widget.takeChildren()
+            widget.childItems = list()
 
+        # Built without a parent and inserted at once, one row insert for all the nodes
         for node in context["result"]["nodes"]:
-            nodeWidgetItem = NodeWidgetItem(widget, constant.NODE_ICON_NAME, node)
-            widget.setExpanded(True)
+            nodeWidgetItem = NodeWidgetItem(None, constant.NODE_ICON_NAME, node)
             widget.setChild(nodeWidgetItem)
 
+        widget.addChildren(widget.childItems)
+        widget.setExpanded(True)
+
         widget.setDisplay(2)
 
+        self.setUpdatesEnabled(True)
+
         LOGGER.error("%s thread finished." % widget.name)
 
     def importThreadError(self, error):
@@ -261,21 +302,24 @@ class FileTreewidget(NormalTreewidget):
         widget.setDisplay(0)
 
     def loadProperty(self, item, column):
-        currentItem = self.selectedItems()[-1] if self.selectedItems() else None
-
-        if not currentItem.isRead:
-            return
-
-        self.__parent__.cachePropertyPage.reset()
+        selectedItems = self.selectedItems()
+        currentItem = selectedItems[-1] if selectedItems else None
 
         if not currentItem:
+            self.__parent__.cachePropertyPage.reset()
             self.__parent__.cachePropertyPage.setEnabled(False)
             LOGGER.warning("Could not found any selected item")
             return
 
+        # A node item loads the property of its file item, only file items know isRead
         if currentItem.hasChild():
             currentItem = currentItem.parent()
 
+        if not currentItem.isRead:
+            return
+
+        self.__parent__.cachePropertyPage.reset()
+
         self.__parent__.cachePropertyPage.setEnabled(True)
         self.__parent__.cachePropertyPage.setWidgetItem(currentItem)
 
@@ -311,16 +355,11 @@ class FileTreewidget(NormalTreewidget):
             self.__parent__.cachePropertyPage.cacheIt(diaplayMessageBox=False)
 
     def localPathExists(self, localPath, widgetItem=None):
-        for child in self.childItems:
-            if child == widgetItem:
-                continue
-            if child.context.get("localPath") and child.context["localPath"] == localPath:
-                result = True
-                break
-        else:
-            result, child = False, None
+        for child in self.itemsByLocalPath.get(localPath, ()):
+            if child != widgetItem:
+                return True, child
 
-        return result, child
+        return False, None
 
 
 if __name__ == "__main__":
@@ -22,6 +22,9 @@ class NormalWidgetItem(QtWidgets.QTreeWidgetItem):
     fontsize = 10
     bold = False
 
+    # The context keys mirrored as item attributes, the rest are only read from the context
+    contextAttributes = ("name", "isRead", "isCached")
+
     def __init__(self, parent, *args, **kwargs):
         super(NormalWidgetItem, self).__init__(parent)
 
@@ -50,15 +53,25 @@ class NormalWidgetItem(QtWidgets.QTreeWidgetItem):
         else:
             self.context = context
 
-        self.contextList = list(self.context.values())
-        for k, v in context.items():
-            setattr(self, k, v)
+        for key in self.contextAttributes:
+            if key in context:
+                setattr(self, key, context[key])
 
 
 class FileWidgetItem(NormalWidgetItem):
     fontsize = 10
     bold = True
 
+    # Foreground, label and read or cache state by display progress, shared by every item
+    displayStates = {
+        0: (QtGui.QBrush(QtGui.QColor(255, 0, 0)), "Read error, %s", "isRead", False),
+        1: (QtGui.QBrush(QtGui.QColor(85, 170, 255)), "Reading file, %s", "isRead", None),
+        2: (QtGui.QBrush(QtGui.QColor(0, 170, 0)), "%s", "isRead", True),
+        3: (QtGui.QBrush(QtGui.QColor(255, 170, 0)), "File caching, %s", "isCached", None),
+        4: (QtGui.QBrush(QtGui.QColor(255, 0, 0)), "Caching error, %s", "isCached", False),
+        5: (QtGui.QBrush(QtGui.QColor(85, 85, 255)), "%s", "isCached", True),
+    }
+
     def __init__(self, parent, *args, **kwargs):
         super(FileWidgetItem, self).__init__(parent, *args, **kwargs)
 
@@ -75,6 +88,16 @@ class FileWidgetItem(NormalWidgetItem):
 
         self.setDisplay(1)
 
+    def setContext(self, context, append=False):
+        localPath = self.context.get("localPath")
+
+        super(FileWidgetItem, self).setContext(context, append=append)
+
+        # Keep the tree local path index in step, it answers localPathExists
+        treewidget = self.treeWidget()
+        if treewidget and self.context.get("localPath") != localPath:
+            treewidget.indexLocalPath(self, localPath, self.context.get("localPath"))
+
     def hasSourceItem(self):
         return True
 
@@ -88,11 +111,9 @@ class FileWidgetItem(NormalWidgetItem):
         if self.checkState(0) == QtCore.Qt.CheckState.Unchecked:
             return False
 
-        for child in self.childItems:
-            if child.checkState(0) == QtCore.Qt.CheckState.Checked:
-                return True
-        else:
-            return False
+        return any(
+            child.checkState(0) == QtCore.Qt.CheckState.Checked for child in self.childItems
+        )
 
     def updateContext(self):
         nodes = list()
@@ -104,46 +125,22 @@ class FileWidgetItem(NormalWidgetItem):
         self.context["filepath"] = self.filepath
 
     def setThreading(self, thread):
+        # The tree counts the running items, hasRunning reads it instead of every item
+        treewidget = self.treeWidget()
+        if treewidget and bool(thread) != bool(self.thread):
+            treewidget.runningCount += 1 if thread else -1
+
         self.thread = thread
 
     def hasThreading(self):
         return self.thread
 
     def setDisplay(self, progress):
-        if progress == 0:
-            qcolor = QtGui.QColor(255, 0, 0)
-            lable = "Read error, %s" % self.filepath
-            self.isRead = False
-
-        if progress == 1:
-            qcolor = QtGui.QColor(85, 170, 255)
-            lable = "Reading file, %s" % self.filepath
-            self.isRead = None
-
-        if progress == 2:
-            qcolor = QtGui.QColor(0, 170, 0)
-            lable = self.filepath
-            self.isRead = True
-
-        if progress == 3:
-            qcolor = QtGui.QColor(255, 170, 0)
-            lable = "File caching, %s" % self.filepath
-            self.isCached = None
-
-        if progress == 4:
-            qcolor = QtGui.QColor(255, 0, 0)
-            lable = "Caching error, %s" % self.filepath
-            self.isCached = False
-
-        if progress == 5:
-            qcolor = QtGui.QColor(85, 85, 255)
-            lable = self.filepath
-            self.isCached = True
-
-        self.setText(0, lable)
-
-        brush = QtGui.QBrush(qcolor)
-        brush.setStyle(QtCore.Qt.SolidPattern)
+        brush, lable, state, value = self.displayStates[progress]
+
+        setattr(self, state, value)
+
+        self.setText(0, lable % self.filepath)
         self.setForeground(0, brush)
 
 